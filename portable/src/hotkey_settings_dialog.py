@@ -5,15 +5,86 @@ ScreenOCR - Hotkey Settings Dialog
 Custom hotkey configuration with conflict detection.
 """
 
+from functools import lru_cache, partial
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QDialogButtonBox, QGroupBox, QGridLayout, QMessageBox,
     QLineEdit, QCheckBox, QWidget, QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QKeySequence, QKeyEvent
 
 
+# Qt key -> hotkey string for non-letter keys (built once at import)
+_KEY_MAP = {
+    Qt.Key.Key_F1: "f1", Qt.Key.Key_F2: "f2", Qt.Key.Key_F3: "f3",
+    Qt.Key.Key_F4: "f4", Qt.Key.Key_F5: "f5", Qt.Key.Key_F6: "f6",
+    Qt.Key.Key_F7: "f7", Qt.Key.Key_F8: "f8", Qt.Key.Key_F9: "f9",
+    Qt.Key.Key_F10: "f10", Qt.Key.Key_F11: "f11", Qt.Key.Key_F12: "f12",
+    Qt.Key.Key_Escape: "esc", Qt.Key.Key_Tab: "tab",
+    Qt.Key.Key_Space: "space", Qt.Key.Key_Return: "enter",
+    Qt.Key.Key_Enter: "enter", Qt.Key.Key_Backspace: "backspace",
+    Qt.Key.Key_Delete: "delete", Qt.Key.Key_Insert: "insert",
+    Qt.Key.Key_Home: "home", Qt.Key.Key_End: "end",
+    Qt.Key.Key_PageUp: "pageup", Qt.Key.Key_PageDown: "pagedown",
+    Qt.Key.Key_Up: "up", Qt.Key.Key_Down: "down",
+    Qt.Key.Key_Left: "left", Qt.Key.Key_Right: "right",
+    Qt.Key.Key_Print: "print", Qt.Key.Key_ScrollLock: "scrolllock",
+    Qt.Key.Key_Pause: "pause", Qt.Key.Key_NumLock: "numlock",
+    Qt.Key.Key_0: "0", Qt.Key.Key_1: "1", Qt.Key.Key_2: "2",
+    Qt.Key.Key_3: "3", Qt.Key.Key_4: "4", Qt.Key.Key_5: "5",
+    Qt.Key.Key_6: "6", Qt.Key.Key_7: "7", Qt.Key.Key_8: "8",
+    Qt.Key.Key_9: "9",
+}
+
+# Keys that are modifiers on their own (ignored while capturing)
+_MODIFIER_KEYS = frozenset({
+    int(Qt.Key.Key_Control), int(Qt.Key.Key_Alt),
+    int(Qt.Key.Key_Shift), int(Qt.Key.Key_Meta),
+})
+
+# Modifier flags in hotkey string order
+_MODIFIERS = (
+    (Qt.KeyboardModifier.ControlModifier.value, "ctrl"),
+    (Qt.KeyboardModifier.AltModifier.value, "alt"),
+    (Qt.KeyboardModifier.ShiftModifier.value, "shift"),
+    (Qt.KeyboardModifier.MetaModifier.value, "win"),
+)
+_MOD_MASK = sum(bit for bit, _ in _MODIFIERS)
+
+
+def _build_mod_strings() -> dict:
+    """Map every modifier bitmask combination to its hotkey prefix."""
+    table = {}
+    for combo in range(1 << len(_MODIFIERS)):
+        mask = 0
+        prefix = ""
+        for i, (bit, name) in enumerate(_MODIFIERS):
+            if combo & (1 << i):
+                mask |= bit
+                prefix += name + "+"
+        table[mask] = prefix
+    return table
+
+
+# Modifier bitmask -> hotkey prefix ("ctrl+shift+" etc.)
+_MOD_STRINGS = _build_mod_strings()
+
+
+@lru_cache(maxsize=128)
+def _format_hotkey_display(hotkey: str) -> str:
+    """Format a hotkey string for display ("ctrl+f1" -> "CTRL+F1")."""
+    display_parts = []
+    for p in hotkey.split('+'):
+        p = p.strip()
+        if len(p) <= 3 and not p.startswith('f'):
+            display_parts.append(p.upper())
+        else:
+            display_parts.append(p.capitalize())
+    return '+'.join(display_parts)
+
+
 class HotkeyCaptureEdit(QLineEdit):
     """Custom line edit that captures keyboard input as hotkey."""
 
@@ -25,42 +96,31 @@ class HotkeyCaptureEdit(QLineEdit):
         self.setPlaceholderText("点击此处并按快捷键...")
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._capturing = False
+        self.setProperty("capturing", False)
         self._current_hotkey = ""
+        self._dirty = False  # Edited since the last set_hotkey()
 
     def focusInEvent(self, event):
         """Start capturing when focused."""
         super().focusInEvent(event)
         self._capturing = True
         self.setPlaceholderText("请按下快捷键组合...")
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: #094771;
-                color: #ffffff;
-                border: 2px solid #007acc;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 13px;
-            }
-        """)
+        self._set_capturing_style(True)
 
     def focusOutEvent(self, event):
         """Stop capturing when focus lost."""
         super().focusOutEvent(event)
         self._capturing = False
         self.setPlaceholderText("点击此处并按快捷键...")
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                border: 1px solid #3e3e3e;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border-color: #007acc;
-            }
-        """)
+        self._set_capturing_style(False)
+
+    def _set_capturing_style(self, capturing: bool):
+        """Toggle the capturing look via a dynamic property (styled by the dialog sheet)."""
+        if self.property("capturing") == capturing:
+            return
+        self.setProperty("capturing", capturing)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def keyPressEvent(self, event: QKeyEvent):
         """Capture key press as hotkey."""
@@ -68,67 +128,36 @@ class HotkeyCaptureEdit(QLineEdit):
             super().keyPressEvent(event)
             return
 
-        # Get modifiers
-        modifiers = []
-        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            modifiers.append("ctrl")
-        if event.modifiers() & Qt.KeyboardModifier.AltModifier:
-            modifiers.append("alt")
-        if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
-            modifiers.append("shift")
-        if event.modifiers() & Qt.KeyboardModifier.MetaModifier:
-            modifiers.append("win")
+        # Get modifier prefix ("ctrl+shift+" etc.)
+        prefix = _MOD_STRINGS[event.modifiers().value & _MOD_MASK]
 
         # Get key
         key = event.key()
 
         # Ignore modifier-only presses
-        if key in (Qt.Key.Key_Control, Qt.Key.Key_Alt, Qt.Key.Key_Shift, Qt.Key.Key_Meta):
+        if key in _MODIFIER_KEYS:
             return
 
         # Convert key to string
-        key_map = {
-            Qt.Key.Key_F1: "f1", Qt.Key.Key_F2: "f2", Qt.Key.Key_F3: "f3",
-            Qt.Key.Key_F4: "f4", Qt.Key.Key_F5: "f5", Qt.Key.Key_F6: "f6",
-            Qt.Key.Key_F7: "f7", Qt.Key.Key_F8: "f8", Qt.Key.Key_F9: "f9",
-            Qt.Key.Key_F10: "f10", Qt.Key.Key_F11: "f11", Qt.Key.Key_F12: "f12",
-            Qt.Key.Key_Escape: "esc", Qt.Key.Key_Tab: "tab",
-            Qt.Key.Key_Space: "space", Qt.Key.Key_Return: "enter",
-            Qt.Key.Key_Enter: "enter", Qt.Key.Key_Backspace: "backspace",
-            Qt.Key.Key_Delete: "delete", Qt.Key.Key_Insert: "insert",
-            Qt.Key.Key_Home: "home", Qt.Key.Key_End: "end",
-            Qt.Key.Key_PageUp: "pageup", Qt.Key.Key_PageDown: "pagedown",
-            Qt.Key.Key_Up: "up", Qt.Key.Key_Down: "down",
-            Qt.Key.Key_Left: "left", Qt.Key.Key_Right: "right",
-            Qt.Key.Key_Print: "print", Qt.Key.Key_ScrollLock: "scrolllock",
-            Qt.Key.Key_Pause: "pause", Qt.Key.Key_NumLock: "numlock",
-            Qt.Key.Key_0: "0", Qt.Key.Key_1: "1", Qt.Key.Key_2: "2",
-            Qt.Key.Key_3: "3", Qt.Key.Key_4: "4", Qt.Key.Key_5: "5",
-            Qt.Key.Key_6: "6", Qt.Key.Key_7: "7", Qt.Key.Key_8: "8",
-            Qt.Key.Key_9: "9",
-        }
-
-        if key in key_map:
-            key_str = key_map[key]
-        elif Qt.Key.Key_A <= key <= Qt.Key.Key_Z:
-            key_str = chr(key).lower()
-        elif Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
-            key_str = chr(key)
-        else:
-            # Try to get key from QKeySequence
-            seq = QKeySequence(key)
-            key_str = seq.toString().lower()
-            if not key_str:
-                return
+        key_str = _KEY_MAP.get(key)
+        if key_str is None:
+            if Qt.Key.Key_A <= key <= Qt.Key.Key_Z:
+                key_str = chr(key).lower()
+            elif Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
+                key_str = chr(key)
+            else:
+                # Try to get key from QKeySequence
+                seq = QKeySequence(key)
+                key_str = seq.toString().lower()
+                if not key_str:
+                    return
 
         # Build hotkey string
-        if modifiers:
-            self._current_hotkey = "+".join(modifiers + [key_str])
-        else:
-            self._current_hotkey = key_str
+        self._current_hotkey = prefix + key_str
 
         self.setText(self._current_hotkey.upper() if len(self._current_hotkey) <= 3 else self._current_hotkey)
         self.hotkey_captured.emit(self._current_hotkey)
+        self._dirty = True
 
         # Clear focus to stop capturing
         self.clearFocus()
@@ -137,20 +166,16 @@ class HotkeyCaptureEdit(QLineEdit):
         """Get the captured hotkey."""
         return self._current_hotkey
 
-    def set_hotkey(self, hotkey: str):
-        """Set the hotkey value."""
+    def is_dirty(self) -> bool:
+        """Whether the hotkey was captured or reset since it was loaded."""
+        return self._dirty
+
+    def set_hotkey(self, hotkey: str, dirty: bool = False):
+        """Set the hotkey value; dirty marks it as edited (see is_dirty())."""
         self._current_hotkey = hotkey
+        self._dirty = dirty
         if hotkey:
-            # Format for display
-            parts = hotkey.split('+')
-            display_parts = []
-            for p in parts:
-                p = p.strip()
-                if len(p) <= 3 and not p.startswith('f'):
-                    display_parts.append(p.upper())
-                else:
-                    display_parts.append(p.capitalize())
-            self.setText('+'.join(display_parts))
+            self.setText(_format_hotkey_display(hotkey))
         else:
             self.clear()
 
@@ -160,11 +185,122 @@ class HotkeySettingsDialog(QDialog):
 
     hotkeys_changed = Signal(dict)
 
+    # Default hotkey values
+    _DEFAULTS = {
+        'hotkey': 'ctrl+shift+o',
+        'hotkey_copy': 'ctrl+c',
+        'hotkey_save': 'ctrl+s',
+        'hotkey_edit': 'ctrl+e',
+    }
+
+    # Dialog-wide stylesheet, applied once instead of per widget
+    _STYLESHEET = """
+        QLabel#title_label {
+            font-size: 16px;
+            font-weight: bold;
+            color: #ffffff;
+        }
+        QLabel#desc_label {
+            color: #a0a0a0;
+            font-size: 12px;
+        }
+        QLabel#hotkey_label {
+            color: #d4d4d4;
+            font-size: 13px;
+        }
+        QLabel#conflict_label {
+            color: #ff6b6b;
+            font-size: 12px;
+        }
+        QCheckBox#enable_checkbox {
+            color: #d4d4d4;
+            font-size: 13px;
+        }
+        QCheckBox#enable_checkbox::indicator {
+            width: 18px;
+            height: 18px;
+        }
+        QScrollArea#hotkey_scroll,
+        QScrollArea#hotkey_scroll > QWidget,
+        QWidget#hotkey_scroll_content {
+            background-color: transparent;
+        }
+        QGroupBox#hotkey_group {
+            color: #d4d4d4;
+            border: 1px solid #3e3e3e;
+            border-radius: 4px;
+            margin-top: 12px;
+            padding-top: 8px;
+            font-weight: bold;
+        }
+        QGroupBox#hotkey_group::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top left;
+            padding: 0 8px;
+        }
+        QLineEdit#hotkey_edit {
+            background-color: #3c3c3c;
+            color: #d4d4d4;
+            border: 1px solid #3e3e3e;
+            border-radius: 4px;
+            padding: 8px;
+            font-size: 13px;
+        }
+        QLineEdit#hotkey_edit:focus {
+            border-color: #007acc;
+        }
+        QLineEdit#hotkey_edit[capturing="true"] {
+            background-color: #094771;
+            color: #ffffff;
+            border: 2px solid #007acc;
+        }
+        QPushButton#reset_btn {
+            background-color: #3c3c3c;
+            color: #d4d4d4;
+            border: 1px solid #3e3e3e;
+            border-radius: 4px;
+            padding: 6px 12px;
+            font-size: 12px;
+            min-width: 70px;
+        }
+        QPushButton#reset_btn:hover {
+            background-color: #4e4e4e;
+            border-color: #007acc;
+        }
+        QPushButton#ok_btn {
+            background-color: #0e639c;
+            color: #ffffff;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 20px;
+            font-size: 13px;
+            min-width: 80px;
+        }
+        QPushButton#ok_btn:hover {
+            background-color: #1177bb;
+        }
+        QPushButton#cancel_btn {
+            background-color: #3c3c3c;
+            color: #d4d4d4;
+            border: 1px solid #3e3e3e;
+            border-radius: 4px;
+            padding: 8px 20px;
+            font-size: 13px;
+            min-width: 80px;
+        }
+        QPushButton#cancel_btn:hover {
+            background-color: #4e4e4e;
+            border-color: #007acc;
+        }
+    """
+
     def __init__(self, settings_manager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
         self.hotkey_edits = {}
         self.original_hotkeys = {}
+        # key_name -> display_name lookup, built once
+        self._display_names = {key: name for key, name, _ in settings_manager.HOTKEYS}
 
         self.setWindowTitle("快捷键设置")
         self.setMinimumWidth(500)
@@ -175,63 +311,44 @@ class HotkeySettingsDialog(QDialog):
 
     def _setup_ui(self):
         """Setup the dialog UI."""
+        # One stylesheet for the whole dialog, parsed once
+        self.setStyleSheet(self._STYLESHEET)
+
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         layout.setContentsMargins(20, 20, 20, 20)
 
         # Title
         title_label = QLabel("自定义快捷键")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #ffffff;")
+        title_label.setObjectName("title_label")
         layout.addWidget(title_label)
 
         # Description
         desc_label = QLabel("点击输入框并按下想要的快捷键组合。功能键(F1-F12)可以单独使用。")
-        desc_label.setStyleSheet("color: #a0a0a0; font-size: 12px;")
+        desc_label.setObjectName("desc_label")
         desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
 
         # Global enable checkbox
         self.enable_checkbox = QCheckBox("启用全局快捷键")
-        self.enable_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #d4d4d4;
-                font-size: 13px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        self.enable_checkbox.setObjectName("enable_checkbox")
         layout.addWidget(self.enable_checkbox)
 
         # Scroll area for hotkey settings
         scroll = QScrollArea()
+        scroll.setObjectName("hotkey_scroll")
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("background-color: transparent;")
 
         scroll_widget = QWidget()
+        scroll_widget.setObjectName("hotkey_scroll_content")
         scroll_layout = QVBoxLayout(scroll_widget)
         scroll_layout.setSpacing(12)
         scroll_layout.setContentsMargins(0, 0, 0, 0)
 
         # Hotkey group
         hotkey_group = QGroupBox("快捷键配置")
-        hotkey_group.setStyleSheet("""
-            QGroupBox {
-                color: #d4d4d4;
-                border: 1px solid #3e3e3e;
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 8px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 8px;
-            }
-        """)
+        hotkey_group.setObjectName("hotkey_group")
         hotkey_layout = QGridLayout(hotkey_group)
         hotkey_layout.setSpacing(12)
         hotkey_layout.setColumnStretch(0, 0)
@@ -243,47 +360,22 @@ class HotkeySettingsDialog(QDialog):
         for key_name, display_name, description in self.settings_manager.HOTKEYS:
             # Label
             label = QLabel(display_name)
-            label.setStyleSheet("color: #d4d4d4; font-size: 13px;")
+            label.setObjectName("hotkey_label")
             label.setToolTip(description)
             hotkey_layout.addWidget(label, row, 0)
 
             # Hotkey capture edit
             hotkey_edit = HotkeyCaptureEdit()
+            hotkey_edit.setObjectName("hotkey_edit")
             hotkey_edit.setMinimumWidth(180)
-            hotkey_edit.setStyleSheet("""
-                QLineEdit {
-                    background-color: #3c3c3c;
-                    color: #d4d4d4;
-                    border: 1px solid #3e3e3e;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-size: 13px;
-                }
-                QLineEdit:focus {
-                    border-color: #007acc;
-                }
-            """)
+            hotkey_edit.hotkey_captured.connect(self._on_hotkey_captured)
             self.hotkey_edits[key_name] = hotkey_edit
             hotkey_layout.addWidget(hotkey_edit, row, 1)
 
             # Reset button
             reset_btn = QPushButton("恢复默认")
-            reset_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3c3c3c;
-                    color: #d4d4d4;
-                    border: 1px solid #3e3e3e;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    font-size: 12px;
-                    min-width: 70px;
-                }
-                QPushButton:hover {
-                    background-color: #4e4e4e;
-                    border-color: #007acc;
-                }
-            """)
-            reset_btn.clicked.connect(lambda checked, k=key_name: self._reset_hotkey(k))
+            reset_btn.setObjectName("reset_btn")
+            reset_btn.clicked.connect(partial(self._reset_hotkey, key_name))
             hotkey_layout.addWidget(reset_btn, row, 2)
 
             row += 1
@@ -296,7 +388,7 @@ class HotkeySettingsDialog(QDialog):
 
         # Conflict warning label
         self.conflict_label = QLabel()
-        self.conflict_label.setStyleSheet("color: #ff6b6b; font-size: 12px;")
+        self.conflict_label.setObjectName("conflict_label")
         self.conflict_label.setWordWrap(True)
         self.conflict_label.hide()
         layout.addWidget(self.conflict_label)
@@ -311,38 +403,11 @@ class HotkeySettingsDialog(QDialog):
         # Style buttons
         ok_btn = button_box.button(QDialogButtonBox.StandardButton.Ok)
         ok_btn.setText("确定")
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0e639c;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 13px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #1177bb;
-            }
-        """)
+        ok_btn.setObjectName("ok_btn")
 
         cancel_btn = button_box.button(QDialogButtonBox.StandardButton.Cancel)
         cancel_btn.setText("取消")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                border: 1px solid #3e3e3e;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 13px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #4e4e4e;
-                border-color: #007acc;
-            }
-        """)
+        cancel_btn.setObjectName("cancel_btn")
 
         layout.addWidget(button_box)
 
@@ -356,28 +421,22 @@ class HotkeySettingsDialog(QDialog):
         )
 
         # Load hotkeys
-        defaults = {
-            'hotkey': 'ctrl+shift+o',
-            'hotkey_copy': 'ctrl+c',
-            'hotkey_save': 'ctrl+s',
-            'hotkey_edit': 'ctrl+e',
-        }
-
         for key_name in self.hotkey_edits:
-            hotkey = self.settings_manager.get(key_name, defaults.get(key_name, ''))
+            hotkey = self.settings_manager.get(key_name, self._DEFAULTS.get(key_name, ''))
             self.original_hotkeys[key_name] = hotkey
             self.hotkey_edits[key_name].set_hotkey(hotkey)
 
+    @Slot(str)
     def _reset_hotkey(self, key_name: str):
         """Reset a hotkey to its default value."""
-        defaults = {
-            'hotkey': 'ctrl+shift+o',
-            'hotkey_copy': 'ctrl+c',
-            'hotkey_save': 'ctrl+s',
-            'hotkey_edit': 'ctrl+e',
-        }
-        default_value = defaults.get(key_name, '')
-        self.hotkey_edits[key_name].set_hotkey(default_value)
+        default_value = self._DEFAULTS.get(key_name, '')
+        # A reset may differ from the loaded value - let get_hotkey_changes() compare it
+        self.hotkey_edits[key_name].set_hotkey(default_value, dirty=True)
+        self.conflict_label.hide()
+
+    @Slot(str)
+    def _on_hotkey_captured(self, hotkey: str):
+        """Clear a stale conflict warning once a new hotkey is captured."""
         self.conflict_label.hide()
 
     def _validate_hotkeys(self) -> tuple[bool, str]:
@@ -394,21 +453,22 @@ class HotkeySettingsDialog(QDialog):
         for key_name, hotkey in new_hotkeys.items():
             is_valid, error = self.settings_manager.validate_hotkey(hotkey)
             if not is_valid:
-                display_name = dict(self.settings_manager.HOTKEYS).get(key_name, key_name)
+                display_name = self._display_names.get(key_name, key_name)
                 return False, f"{display_name}: {error}"
 
         # Check for conflicts
         conflicts = self.settings_manager.check_hotkey_conflicts(new_hotkeys)
         if conflicts:
-            conflict_names = []
-            for key1, key2, hotkey in conflicts:
-                name1 = dict(self.settings_manager.HOTKEYS).get(key1, key1)
-                name2 = dict(self.settings_manager.HOTKEYS).get(key2, key2)
-                conflict_names.append(f"{name1} 和 {name2} ({hotkey})")
-            return False, f"快捷键冲突: {', '.join(conflict_names)}"
+            names = self._display_names
+            msg = ", ".join(
+                f"{names.get(key1, key1)} 和 {names.get(key2, key2)} ({hotkey})"
+                for key1, key2, hotkey in conflicts
+            )
+            return False, f"快捷键冲突: {msg}"
 
         return True, ""
 
+    @Slot()
     def _on_accept(self):
         """Handle OK button click."""
         is_valid, error = self._validate_hotkeys()
@@ -439,6 +499,8 @@ class HotkeySettingsDialog(QDialog):
         """Get the changed hotkeys."""
         changes = {}
         for key_name, edit in self.hotkey_edits.items():
+            if not edit.is_dirty():
+                continue
             new_hotkey = edit.get_hotkey().strip().lower()
             old_hotkey = self.original_hotkeys.get(key_name, '')
             if new_hotkey != old_hotkey:
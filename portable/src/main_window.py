@@ -4,18 +4,31 @@
 ScreenOCR - Main Window
 """
 
+import html
 import logging
+import logging.handlers
 import sys
 import os
 import tempfile
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from operator import itemgetter
+from time import monotonic
 
 # Setup logging for debugging
 log_file = os.path.join(tempfile.gettempdir(), "screenocr_batch.log")
+log_format = '%(asctime)s - %(levelname)s - %(message)s'
+# The file handler formats records itself when the buffer below flushes
+_log_file_handler = logging.FileHandler(log_file, encoding='utf-8')
+_log_file_handler.setFormatter(logging.Formatter(log_format))
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=log_format,
     handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
+        # Buffered: lines reach the file in batches of 100 (or at once on an
+        # error / at exit) instead of one write per log call
+        logging.handlers.MemoryHandler(capacity=100, target=_log_file_handler),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -27,10 +40,21 @@ from PySide6.QtWidgets import (
     QTextEdit, QGroupBox, QPushButton, QComboBox,
     QMessageBox, QListWidget, QListWidgetItem, QDialog,
     QDialogButtonBox, QLineEdit, QScrollArea, QFrame,
-    QProgressBar
+    QProgressBar, QApplication, QFileDialog, QStackedWidget, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QSize, Signal, QObject, QThread
-from PySide6.QtGui import QAction, QIcon, QPixmap, QImage, QColor
+from PySide6.QtCore import Qt, QSize, Signal, QObject, QThread, QTimer
+from PySide6.QtGui import QAction, QIcon, QPixmap, QImage, QTextCursor
+
+
+@dataclass
+class OCRResult:
+    """Recognized lines handed from the OCR workers to the UI."""
+    items: list  # (text, confidence) tuples
+
+    @cached_property
+    def text(self) -> str:
+        """Plain text, one line per item - joined once, on first use."""
+        return '\n'.join(map(itemgetter(0), self.items))
 
 
 class OCRWorker(QObject):
@@ -39,7 +63,7 @@ class OCRWorker(QObject):
     [Task 763] Changed from QTimer (main thread) to QThread (background thread)
     to prevent UI freezing during OCR operations.
     """
-    finished = Signal(str, float, list)  # (result_text, elapsed_time, confidence_items)
+    finished = Signal(object, float)  # (OCRResult, elapsed_time)
     error = Signal(str)  # error message
 
     def __init__(self, ocr_engine, image_path):
@@ -49,17 +73,15 @@ class OCRWorker(QObject):
 
     def run(self):
         """Execute OCR in background thread."""
-        import time
         try:
-            start_time = time.time()
+            start_time = monotonic()
 
             # Use regular OCR
-            confidence_items = self.ocr_engine.recognize_with_confidence(self.image_path)
-            result_text = '\n'.join([item[0] for item in confidence_items])
+            result = OCRResult(self.ocr_engine.recognize_with_confidence(self.image_path))
 
-            elapsed = time.time() - start_time
+            elapsed = monotonic() - start_time
 
-            self.finished.emit(result_text, elapsed, confidence_items)
+            self.finished.emit(result, elapsed)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -81,14 +103,13 @@ class DocumentOCRWorker(QObject):
 
     def run(self):
         """Execute document structure analysis in background thread."""
-        import time
         try:
-            start_time = time.time()
+            start_time = monotonic()
 
             # Use PP-StructureV3 for document analysis
             result = self.ocr_engine.recognize_document(self.image_path, self.doc_settings)
 
-            elapsed = time.time() - start_time
+            elapsed = monotonic() - start_time
 
             self.finished.emit(result, elapsed)
         except Exception as e:
@@ -96,86 +117,98 @@ class DocumentOCRWorker(QObject):
 
 
 class BatchOCRWorker(QObject):
-    """Worker for running batch OCR - processes files one at a time using QTimer."""
+    """Worker for running batch OCR - processes all files in a background thread."""
     progress = Signal(int, int, str)  # (current, total, current_file)
-    fileFinished = Signal(int, str, str, float, list)  # (index, file_path, result_text, elapsed, confidence_items)
+    fileFinished = Signal(int, str, object, float)  # (index, file_path, OCRResult, elapsed)
     finished = Signal()  # all files done
     error = Signal(int, str, str)  # (index, file_path, error_msg)
 
-    def __init__(self, ocr_engine, file_paths, parent=None):
-        super().__init__(parent)
+    PREFETCH_DEPTH = 2  # Files read ahead of the one being recognized
+
+    def __init__(self, ocr_engine, file_paths):
+        super().__init__()
         self.ocr_engine = ocr_engine
         self.file_paths = file_paths
         self._stopped = False
-        self._current_index = 0
-        self._timer = None
 
     def stop(self):
-        """Stop the batch processing."""
+        """Stop the batch processing after the current file."""
         self._stopped = True
-        if self._timer:
-            self._timer.stop()
 
-    def start(self):
-        """Start processing files one at a time."""
-        from PySide6.QtCore import QTimer
-        self._current_index = 0
-        self._stopped = False
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._process_next_file)
-        self._timer.setSingleShot(True)
-        self._timer.start(10)  # Start after 10ms
-
-    def _process_next_file(self):
-        """Process the next file in the queue."""
-        import time
-
-        if self._stopped or self._current_index >= len(self.file_paths):
-            logger.info("[BatchOCR] Batch processing finished")
-            self.finished.emit()
-            return
+    def _prefetch_files(self, prefetched):
+        """Read upcoming files into the OS cache while the current one is recognized."""
+        try:
+            for file_path in self.file_paths:
+                if self._stopped:
+                    break
+                try:
+                    with open(file_path, 'rb') as f:
+                        while f.read(1 << 20):
+                            pass
+                except OSError:
+                    pass  # The OCR call reports unreadable files
+                prefetched.put(file_path)  # Blocks while PREFETCH_DEPTH files are ahead
+        finally:
+            prefetched.put(None)  # End marker, so run() never waits on a stopped prefetcher
+
+    def run(self):
+        """Process the files one after another in the worker thread."""
+        import queue
+        import threading
+
+        # Disk reads of the next files overlap with OCR of the current one
+        prefetched = queue.Queue(maxsize=self.PREFETCH_DEPTH)
+        threading.Thread(target=self._prefetch_files, args=(prefetched,), daemon=True).start()
 
-        file_path = self.file_paths[self._current_index]
         total = len(self.file_paths)
-        i = self._current_index
+        for i in range(total):
+            file_path = prefetched.get()
+            if file_path is None or self._stopped:
+                break
 
-        logger.debug(f"[BatchOCR] Processing file {i+1}/{total}: {file_path}")
-        self.progress.emit(i + 1, total, file_path)
+            logger.debug("[BatchOCR] Processing file %d/%d: %s", i + 1, total, file_path)
+            self.progress.emit(i + 1, total, file_path)
 
-        try:
-            start_time = time.time()
-            confidence_items = self.ocr_engine.recognize_with_confidence(file_path)
-            elapsed = time.time() - start_time
-            result_text = '\n'.join([item[0] for item in confidence_items])
+            try:
+                start_time = monotonic()
+                result = OCRResult(self.ocr_engine.recognize_with_confidence(file_path))
+                elapsed = monotonic() - start_time
 
-            logger.debug(f"[BatchOCR] File {i+1} completed: {len(result_text)} chars, {elapsed:.2f}s")
-            self.fileFinished.emit(i, file_path, result_text, elapsed, confidence_items)
-        except Exception as e:
-            logger.error(f"[BatchOCR] Error processing file {i+1}: {e}")
-            self.error.emit(i, file_path, str(e))
+                logger.debug("[BatchOCR] File %d completed: %d chars, %.2fs",
+                             i + 1, len(result.text), elapsed)
+                self.fileFinished.emit(i, file_path, result, elapsed)
+            except Exception as e:
+                logger.error("[BatchOCR] Error processing file %d: %s", i + 1, e)
+                self.error.emit(i, file_path, str(e))
 
-        self._current_index += 1
+        # Unblock a prefetcher still waiting to queue files so it can exit
+        while not prefetched.empty():
+            prefetched.get_nowait()
 
-        # Schedule next file processing
-        if not self._stopped and self._current_index < len(self.file_paths):
-            self._timer.start(10)
-        else:
-            logger.info("[BatchOCR] Batch processing finished")
-            self.finished.emit()
+        logger.info("[BatchOCR] Batch processing finished")
+        self.finished.emit()
 
 from ocr_engine import OCREngine
 from screenshot_overlay import ScreenshotOverlay
 from history_manager import HistoryManager
 from settings import SettingsManager, AppSettings
+from hotkey_settings_dialog import HotkeySettingsDialog
 
 
 class ImagePreviewWidget(QWidget):
     """Widget for displaying screenshot preview."""
 
+    RESIZE_DEBOUNCE_MS = 30  # Coalesce resize events during a window drag
+    RESCALE_TOLERANCE = 4  # Pixels the label may change before re-scaling
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
         self._pixmap = None
+        self._last_scaled_size = QSize()  # Label size of the displayed scaled pixmap
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._update_display)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -219,16 +252,26 @@ class ImagePreviewWidget(QWidget):
         """Set image from PIL Image or QImage."""
         if image is None:
             self._pixmap = None
+            self._last_scaled_size = QSize()
             self.image_label.setText("暂无截图")
             return
 
         # Convert PIL Image to QPixmap
         if hasattr(image, 'tobytes'):
-            # PIL Image
-            data = image.convert('RGBA').tobytes('raw', 'RGBA')
+            # PIL Image - pass RGB/RGBA buffers as they are; only other
+            # modes need a conversion pass
+            if image.mode == 'RGB':
+                image_format, channels = QImage.Format.Format_RGB888, 3
+            else:
+                if image.mode != 'RGBA':
+                    image = image.convert('RGBA')
+                image_format, channels = QImage.Format.Format_RGBA8888, 4
+            data = image.tobytes()
+            # QImage wraps data without copying; fromImage() copies it
+            # while data is still alive
             qimage = QImage(
                 data, image.width, image.height,
-                QImage.Format.Format_RGBA8888
+                image.width * channels, image_format
             )
             self._pixmap = QPixmap.fromImage(qimage)
         elif isinstance(image, QImage):
@@ -238,6 +281,7 @@ class ImagePreviewWidget(QWidget):
         else:
             return
 
+        self._last_scaled_size = QSize()  # New image - always re-scale
         self._update_display()
 
     def _update_display(self):
@@ -246,6 +290,12 @@ class ImagePreviewWidget(QWidget):
             return
 
         label_size = self.image_label.size()
+        if (self._last_scaled_size.isValid()
+                and abs(label_size.width() - self._last_scaled_size.width()) < self.RESCALE_TOLERANCE
+                and abs(label_size.height() - self._last_scaled_size.height()) < self.RESCALE_TOLERANCE):
+            return
+        self._last_scaled_size = label_size
+
         scaled = self._pixmap.scaled(
             label_size,
             Qt.AspectRatioMode.KeepAspectRatio,
@@ -256,7 +306,8 @@ class ImagePreviewWidget(QWidget):
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if self._pixmap:
-            self._update_display()
+            # Re-scale once the drag pauses rather than on every resize event
+            self._resize_timer.start(self.RESIZE_DEBOUNCE_MS)
 
 
 class ResultTextWidget(QWidget):
@@ -265,15 +316,23 @@ class ResultTextWidget(QWidget):
     copyRequested = Signal()
     saveRequested = Signal()
 
+    # Paragraph openers for the three confidence colors, built once
+    _P_LOW = '<p style="margin:0; white-space:pre-wrap; color:#ff6b6b">'  # Red for very low confidence
+    _P_WARN = '<p style="margin:0; white-space:pre-wrap; color:#ffcc00">'  # Yellow for low confidence
+    _P_NORMAL = '<p style="margin:0; white-space:pre-wrap; color:#d4d4d4">'  # Normal color for good confidence
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.confidence_items = []  # Store (text, confidence) tuples
+        self._result = None  # OCRResult backing confidence_items
+        self._confidence_range = None  # (min, max) confidence of confidence_items
         self.confidence_threshold = 0.8  # Default threshold
         self.show_confidence = True  # Show confidence by default
         self._is_editable = False  # Edit mode toggle
         self._plain_text_backup = ""  # Backup for plain text when switching modes
         self._smart_layout = False  # Smart layout mode (disabled by default)
         self._merged_text = ""  # Merged text for smart layout
+        self._display_dirty = False  # Refresh deferred until the widget is shown
         self.setup_ui()
 
     def setup_ui(self):
@@ -509,7 +568,17 @@ class ResultTextWidget(QWidget):
 
     def on_threshold_changed(self, index):
         """Handle confidence threshold change."""
+        old_threshold = self.confidence_threshold
         self.confidence_threshold = self.threshold_combo.currentData()
+
+        # Only items between the old and new threshold (and not already red)
+        # change color - skip the rebuild if there are none
+        if self._confidence_range is not None and not self._display_dirty:
+            low = max(0.6, min(old_threshold, self.confidence_threshold))
+            high = max(old_threshold, self.confidence_threshold)
+            conf_min, conf_max = self._confidence_range
+            if conf_max < low or conf_min >= high:
+                return
         self.refresh_display()
 
     def on_toggle_confidence(self, checked):
@@ -565,8 +634,6 @@ class ResultTextWidget(QWidget):
 
     def save_to_file(self):
         """Save edited text to file. Returns True if saved successfully."""
-        from PySide6.QtWidgets import QFileDialog
-
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "保存文本",
@@ -586,11 +653,24 @@ class ResultTextWidget(QWidget):
 
     def set_confidence_items(self, items):
         """Set the OCR result with confidence scores."""
-        self.confidence_items = items
+        self.set_result(OCRResult(items))
+
+    def set_result(self, result):
+        """Set the OCR result from an OCRResult, reusing its joined text."""
+        self._result = result
+        self.confidence_items = result.items
+        confidences = list(map(itemgetter(1), result.items))
+        self._confidence_range = (min(confidences), max(confidences)) if confidences else None
         self.refresh_display()
 
     def refresh_display(self):
         """Refresh the display with current confidence settings."""
+        if not self.isVisible():
+            # Rebuilt in showEvent - e.g. while document mode is in front
+            self._display_dirty = True
+            return
+        self._display_dirty = False
+
         # If smart layout is enabled and we have merged text, display it
         if self._smart_layout and self._merged_text:
             self.text_edit.setPlainText(self._merged_text)
@@ -599,50 +679,55 @@ class ResultTextWidget(QWidget):
         if not self.confidence_items:
             return
 
-        self.text_edit.clear()
-        cursor = self.text_edit.textCursor()
-
-        for i, (text, confidence) in enumerate(self.confidence_items):
+        # Build the whole document as one HTML string so Qt lays it out once,
+        # one paragraph (block) per item as before
+        parts = []
+        threshold = self.confidence_threshold
+        for text, confidence in self.confidence_items:
             # Determine text color based on confidence
             if confidence < 0.6:
-                color = "#ff6b6b"  # Red for very low confidence
-            elif confidence < self.confidence_threshold:
-                color = "#ffcc00"  # Yellow for low confidence
+                opener = self._P_LOW
+            elif confidence < threshold:
+                opener = self._P_WARN
             else:
-                color = "#d4d4d4"  # Normal color for good confidence
+                opener = self._P_NORMAL
 
-            # Create formatted text
+            # Create formatted text (escaped - OCR output is untrusted)
             if self.show_confidence:
-                display_text = f"[{confidence:.1%}] {text}"
+                display_text = html.escape(f"[{confidence:.1%}] {text}")
             else:
-                display_text = text
+                display_text = html.escape(text)
 
-            # Insert with color
-            char_format = cursor.charFormat()
-            char_format.setForeground(QColor(color))
-            cursor.setCharFormat(char_format)
-            cursor.insertText(display_text)
+            parts.append(f'{opener}{display_text}</p>')
 
-            # Add newline between items
-            if i < len(self.confidence_items) - 1:
-                cursor.insertText("\n")
+        self.text_edit.setUpdatesEnabled(False)
+        self.text_edit.setHtml(''.join(parts))
+        self.text_edit.moveCursor(QTextCursor.MoveOperation.End)
+        self.text_edit.setUpdatesEnabled(True)
 
-        self.text_edit.setTextCursor(cursor)
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._display_dirty:
+            self.refresh_display()
 
     def set_text(self, text):
         """Set the OCR result text (fallback for plain text)."""
+        self._display_dirty = False  # Don't let a deferred refresh overwrite it
         self.text_edit.setPlainText(text)
 
     def get_text(self):
         """Get the OCR result text (without confidence markers)."""
         if self.confidence_items:
-            return '\n'.join([item[0] for item in self.confidence_items])
+            return self._result.text
         return self.text_edit.toPlainText()
 
     def clear(self):
         """Clear the text and confidence items."""
         self.text_edit.clear()
         self.confidence_items = []
+        self._result = None
+        self._confidence_range = None
+        self._display_dirty = False
 
 
 class DocumentResultWidget(QWidget):
@@ -758,6 +843,14 @@ class DocumentResultWidget(QWidget):
 class HistoryDialog(QDialog):
     """Dialog for viewing and managing OCR history."""
 
+    # Emitted after records are deleted, so cached OCR text can be dropped too
+    recordsDeleted = Signal()
+
+    # Line breaks and tabs shown as spaces in the one-line previews
+    _PREVIEW_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+    SEARCH_LIMIT = 50  # Max search matches listed
+
     def __init__(self, history_manager, parent=None):
         super().__init__(parent)
         self.history_manager = history_manager
@@ -790,6 +883,7 @@ class HistoryDialog(QDialog):
         # History list
         self.history_list = QListWidget()
         self.history_list.setAlternatingRowColors(True)
+        self.history_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.history_list.setStyleSheet("""
             QListWidget {
                 background-color: #1e1e1e;
@@ -854,23 +948,32 @@ class HistoryDialog(QDialog):
 
     def load_history(self, query: str = ""):
         """Load history records into list."""
-        self.history_list.clear()
-
         if query:
-            records = self.history_manager.search(query)
+            records = self.history_manager.search(query, limit=self.SEARCH_LIMIT)
         else:
             records = self.history_manager.get_records(limit=100)
 
+        # Build every item before touching the list
+        items = []
         for record in records:
             # Create list item with timestamp and text preview
-            text_preview = record.text[:80].replace('\n', ' ')
+            text_preview = record.text[:80].translate(self._PREVIEW_TRANS)
             if len(record.text) > 80:
                 text_preview += "..."
 
             item_text = f"[{record.timestamp}] {text_preview}"
             item = QListWidgetItem(item_text)
             item.setData(Qt.ItemDataRole.UserRole, record.id)
+            items.append(item)
+
+        # Swap the contents in one pass - repaint and emit once, not per item
+        self.history_list.setUpdatesEnabled(False)
+        self.history_list.blockSignals(True)
+        self.history_list.clear()
+        for item in items:
             self.history_list.addItem(item)
+        self.history_list.blockSignals(False)
+        self.history_list.setUpdatesEnabled(True)
 
         count = self.history_manager.get_count()
         self.status_label.setText(f"共 {count} 条记录")
@@ -893,8 +996,6 @@ class HistoryDialog(QDialog):
 
     def copy_selected(self):
         """Copy selected record text to clipboard."""
-        from PySide6.QtWidgets import QApplication
-
         current = self.history_list.currentItem()
         if current:
             record_id = current.data(Qt.ItemDataRole.UserRole)
@@ -905,19 +1006,48 @@ class HistoryDialog(QDialog):
                 self.status_label.setText("已复制到剪贴板！")
 
     def delete_selected(self):
-        """Delete selected record."""
-        current = self.history_list.currentItem()
-        if current:
-            record_id = current.data(Qt.ItemDataRole.UserRole)
+        """Delete the selected records (Shift skips the confirmation)."""
+        items = self.history_list.selectedItems()
+        if not items:
+            current = self.history_list.currentItem()
+            items = [current] if current else []
+        if not items:
+            return
+
+        if not QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier:
+            message = ("确定要删除这条记录吗？" if len(items) == 1
+                       else f"确定要删除选中的 {len(items)} 条记录吗？")
             reply = QMessageBox.question(
                 self, "确认删除",
-                "确定要删除这条记录吗？",
+                message,
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
-            if reply == QMessageBox.StandardButton.Yes:
-                self.history_manager.delete_record(record_id)
-                self.load_history(self.search_input.text())
-                self.preview_text.clear()
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+
+        record_ids = [item.data(Qt.ItemDataRole.UserRole) for item in items]
+        self.history_manager.delete_records(record_ids)
+        self.recordsDeleted.emit()
+
+        query = self.search_input.text()
+        if query and self.history_list.count() >= self.SEARCH_LIMIT:
+            # A capped search may have more matches to show now
+            self.load_history(query)
+        else:
+            self.history_list.setUpdatesEnabled(False)
+            self.history_list.blockSignals(True)
+            for item in items:
+                self.history_list.takeItem(self.history_list.row(item))
+            self.history_list.blockSignals(False)
+            self.history_list.setUpdatesEnabled(True)
+            self.status_label.setText(f"共 {self.history_manager.get_count()} 条记录")
+
+        # Show the row that inherited the selection, if any
+        current = self.history_list.currentItem()
+        if current is not None:
+            self.on_item_selected(current, None)
+        else:
+            self.preview_text.clear()
 
     def restore_selected(self):
         """Restore selected record to main window."""
@@ -938,6 +1068,7 @@ class HistoryDialog(QDialog):
         )
         if reply == QMessageBox.StandardButton.Yes:
             self.history_manager.clear_all()
+            self.recordsDeleted.emit()
             self.load_history()
             self.preview_text.clear()
 
@@ -945,19 +1076,79 @@ class HistoryDialog(QDialog):
 class BatchOCRDialog(QDialog):
     """Dialog for batch OCR processing."""
 
+    SUMMARY_FLUSH_MS = 100  # Coalesce per-file summary lines into one widget update
+
+    # Button styles, set once on the dialog and matched by object name
+    _BUTTON_QSS = """
+        QPushButton#secondaryButton, QPushButton#closeButton {
+            background-color: #3c3c3c;
+            color: #d4d4d4;
+            border: 1px solid #555555;
+            border-radius: 4px;
+            padding: 6px 16px;
+        }
+        QPushButton#closeButton {
+            padding: 8px 24px;
+        }
+        QPushButton#secondaryButton:hover, QPushButton#closeButton:hover {
+            background-color: #4c4c4c;
+            border-color: #007acc;
+        }
+        QPushButton#exportButton, QPushButton#startButton, QPushButton#stopButton {
+            color: #ffffff;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 24px;
+        }
+        QPushButton#exportButton {
+            background-color: #238636;
+            padding: 8px 16px;
+        }
+        QPushButton#exportButton:hover {
+            background-color: #2ea043;
+        }
+        QPushButton#startButton {
+            background-color: #0e639c;
+            font-weight: bold;
+        }
+        QPushButton#startButton:hover {
+            background-color: #1177bb;
+        }
+        QPushButton#stopButton {
+            background-color: #da3633;
+        }
+        QPushButton#stopButton:hover {
+            background-color: #f85149;
+        }
+        QPushButton#exportButton:disabled, QPushButton#startButton:disabled,
+        QPushButton#stopButton:disabled {
+            background-color: #3e3e3e;
+            color: #6e6e6e;
+        }
+    """
+
     def __init__(self, ocr_engine, parent=None):
         super().__init__(parent)
         self.ocr_engine = ocr_engine
         self.file_paths = []
+        self._file_path_set = set()  # Mirrors file_paths for O(1) duplicate checks
         self.results = []  # Store (file_path, result_text, elapsed) tuples
-        self._batch_worker = None  # No thread needed
+        self._batch_worker = None
+        self._batch_thread = None
+        self._summary_buffer = []  # Summary lines not yet shown in results_summary
         self.setup_ui()
 
+        self._summary_flush_timer = QTimer(self)
+        self._summary_flush_timer.setSingleShot(True)
+        self._summary_flush_timer.setInterval(self.SUMMARY_FLUSH_MS)
+        self._summary_flush_timer.timeout.connect(self._flush_summary)
+
     def setup_ui(self):
         """Setup dialog UI."""
         self.setWindowTitle("批量 OCR 处理")
         self.setMinimumSize(700, 500)
         self.resize(800, 600)
+        self.setStyleSheet(self._BUTTON_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -991,55 +1182,19 @@ class BatchOCRDialog(QDialog):
 
         self.add_files_btn = QPushButton("添加文件")
         self.add_files_btn.clicked.connect(self.add_files)
-        self.add_files_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px 16px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-                border-color: #007acc;
-            }
-        """)
+        self.add_files_btn.setObjectName("secondaryButton")
         file_btn_layout.addWidget(self.add_files_btn)
 
         self.clear_files_btn = QPushButton("清空列表")
         self.clear_files_btn.clicked.connect(self.clear_files)
-        self.clear_files_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px 16px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-                border-color: #007acc;
-            }
-        """)
+        self.clear_files_btn.setObjectName("secondaryButton")
         file_btn_layout.addWidget(self.clear_files_btn)
 
         file_btn_layout.addStretch()
 
         self.remove_file_btn = QPushButton("移除选中")
         self.remove_file_btn.clicked.connect(self.remove_selected_file)
-        self.remove_file_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px 16px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-                border-color: #007acc;
-            }
-        """)
+        self.remove_file_btn.setObjectName("secondaryButton")
         file_btn_layout.addWidget(self.remove_file_btn)
 
         file_layout.addLayout(file_btn_layout)
@@ -1107,91 +1262,31 @@ class BatchOCRDialog(QDialog):
         self.export_btn = QPushButton("导出结果")
         self.export_btn.clicked.connect(self.export_results)
         self.export_btn.setEnabled(False)
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #238636;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #2ea043;
-            }
-            QPushButton:disabled {
-                background-color: #3e3e3e;
-                color: #6e6e6e;
-            }
-        """)
+        self.export_btn.setObjectName("exportButton")
         button_layout.addWidget(self.export_btn)
 
         button_layout.addStretch()
 
         self.start_btn = QPushButton("开始处理")
         self.start_btn.clicked.connect(self.start_batch_processing)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0e639c;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 24px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1177bb;
-            }
-            QPushButton:disabled {
-                background-color: #3e3e3e;
-                color: #6e6e6e;
-            }
-        """)
+        self.start_btn.setObjectName("startButton")
         button_layout.addWidget(self.start_btn)
 
         self.stop_btn = QPushButton("停止")
         self.stop_btn.clicked.connect(self.stop_batch_processing)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #da3633;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 24px;
-            }
-            QPushButton:hover {
-                background-color: #f85149;
-            }
-            QPushButton:disabled {
-                background-color: #3e3e3e;
-                color: #6e6e6e;
-            }
-        """)
+        self.stop_btn.setObjectName("stopButton")
         button_layout.addWidget(self.stop_btn)
 
         self.close_btn = QPushButton("关闭")
         self.close_btn.clicked.connect(self.reject)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 24px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-                border-color: #007acc;
-            }
-        """)
+        self.close_btn.setObjectName("closeButton")
         button_layout.addWidget(self.close_btn)
 
         layout.addLayout(button_layout)
 
     def add_files(self):
         """Add image files to the list."""
-        from PySide6.QtWidgets import QFileDialog
-
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "选择图片文件",
@@ -1200,7 +1295,8 @@ class BatchOCRDialog(QDialog):
         )
 
         for file_path in files:
-            if file_path not in self.file_paths:
+            if file_path not in self._file_path_set:
+                self._file_path_set.add(file_path)
                 self.file_paths.append(file_path)
                 item = QListWidgetItem(file_path)
                 self.file_list.addItem(item)
@@ -1212,12 +1308,13 @@ class BatchOCRDialog(QDialog):
         current_row = self.file_list.currentRow()
         if current_row >= 0:
             self.file_list.takeItem(current_row)
-            del self.file_paths[current_row]
+            self._file_path_set.discard(self.file_paths.pop(current_row))
         self.update_status()
 
     def clear_files(self):
         """Clear all files from the list."""
         self.file_paths.clear()
+        self._file_path_set.clear()
         self.file_list.clear()
         self.results.clear()
         self.update_status()
@@ -1243,6 +1340,7 @@ class BatchOCRDialog(QDialog):
 
         # Clear previous results
         self.results.clear()
+        self._summary_buffer.clear()
         self.results_summary.clear()
 
         # Update UI
@@ -1257,21 +1355,24 @@ class BatchOCRDialog(QDialog):
         self.progress_bar.setValue(0)
 
         # Clean up any previous worker
-        if self._batch_worker:
-            self._batch_worker.stop()
-            self._batch_worker = None
+        self._cleanup_batch_thread()
 
-        # Create worker (no thread needed - uses QTimer)
-        self._batch_worker = BatchOCRWorker(self.ocr_engine, self.file_paths, parent=self)
+        # Run the whole batch in one worker thread; signals are queued back
+        # to the UI thread
+        self._batch_thread = QThread()
+        self._batch_worker = BatchOCRWorker(self.ocr_engine, list(self.file_paths))
+        self._batch_worker.moveToThread(self._batch_thread)
 
         # Connect signals
+        self._batch_thread.started.connect(self._batch_worker.run)
         self._batch_worker.progress.connect(self.on_batch_progress)
         self._batch_worker.fileFinished.connect(self.on_file_finished)
         self._batch_worker.error.connect(self.on_batch_error)
         self._batch_worker.finished.connect(self.on_batch_finished)
+        self._batch_worker.finished.connect(self._batch_thread.quit)
 
         # Start processing
-        self._batch_worker.start()
+        self._batch_thread.start()
 
     def stop_batch_processing(self):
         """Stop batch OCR processing."""
@@ -1285,27 +1386,45 @@ class BatchOCRDialog(QDialog):
         self.status_label.setText(f"正在处理: {current}/{total}")
         self.current_file_label.setText(f"当前文件: {current_file}")
 
-    def on_file_finished(self, index, file_path, result_text, elapsed, confidence_items):
+    def on_file_finished(self, index, file_path, result, elapsed):
         """Handle single file completion."""
+        result_text = result.text
         self.results.append((file_path, result_text, elapsed))
 
         # Update progress bar
         self.progress_bar.setValue(index + 1)
 
         # Add to summary
-        file_name = file_path.split('/')[-1].split('\\')[-1]
-        summary = f"[{index + 1}] {file_name} - {elapsed:.2f}s - {len(result_text)} 字符\n"
-        self.results_summary.append(summary)
+        file_name = os.path.basename(file_path.replace('\\', '/'))
+        self._queue_summary(f"[{index + 1}] {file_name} - {elapsed:.2f}s - {len(result_text)} 字符\n")
 
     def on_batch_error(self, index, file_path, error_msg):
         """Handle batch processing error."""
-        file_name = file_path.split('/')[-1].split('\\')[-1]
-        error_summary = f"[{index + 1}] {file_name} - 错误: {error_msg}\n"
-        self.results_summary.append(error_summary)
+        file_name = os.path.basename(file_path.replace('\\', '/'))
+        self._queue_summary(f"[{index + 1}] {file_name} - 错误: {error_msg}\n")
+
+    def _queue_summary(self, line):
+        """Buffer a summary line; the timer writes buffered lines in one go."""
+        self._summary_buffer.append(line)
+        if not self._summary_flush_timer.isActive():
+            self._summary_flush_timer.start()
+
+    def _flush_summary(self):
+        """Append all buffered summary lines to the results summary."""
+        if not self._summary_buffer:
+            return
+        # Same layout as one append() per line: each "line\n" as its own
+        # paragraph, so entries stay separated by a blank line
+        separator = '' if self.results_summary.document().isEmpty() else '\n'
+        self.results_summary.moveCursor(QTextCursor.MoveOperation.End)
+        self.results_summary.insertPlainText(separator + '\n'.join(self._summary_buffer))
+        self._summary_buffer.clear()
 
     def on_batch_finished(self):
         """Handle batch processing completion."""
         logger.info("[BatchOCR] on_batch_finished called")
+        self._summary_flush_timer.stop()
+        self._flush_summary()
         try:
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
@@ -1327,8 +1446,6 @@ class BatchOCRDialog(QDialog):
 
     def export_results(self):
         """Export batch results to a text file."""
-        from PySide6.QtWidgets import QFileDialog
-
         if not self.results:
             QMessageBox.warning(self, "警告", "没有可导出的结果")
             return
@@ -1341,35 +1458,55 @@ class BatchOCRDialog(QDialog):
         )
 
         if file_path:
+            separator = "=" * 60
+            # Build the whole report first and write it in one call
+            parts = [f"{separator}\nScreenOCR 批量处理结果\n{separator}\n\n"]
+            for i, (img_path, result_text, elapsed) in enumerate(self.results):
+                parts.append(f"--- 文件 {i + 1}: {img_path} ---\n"
+                             f"处理时间: {elapsed:.2f} 秒\n"
+                             f"识别结果:\n{result_text}\n\n{separator}\n\n")
+
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("=" * 60 + "\n")
-                    f.write("ScreenOCR 批量处理结果\n")
-                    f.write("=" * 60 + "\n\n")
-
-                    for i, (img_path, result_text, elapsed) in enumerate(self.results):
-                        f.write(f"--- 文件 {i + 1}: {img_path} ---\n")
-                        f.write(f"处理时间: {elapsed:.2f} 秒\n")
-                        f.write("识别结果:\n")
-                        f.write(result_text)
-                        f.write("\n\n" + "=" * 60 + "\n\n")
+                    f.write(''.join(parts))
 
                 QMessageBox.information(self, "成功", f"结果已导出到:\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "导出失败", f"导出文件失败:\n{str(e)}")
 
+    def _cleanup_batch_thread(self):
+        """Stop the batch worker without waiting for the file in progress."""
+        worker, thread = self._batch_worker, self._batch_thread
+        self._batch_worker = None
+        self._batch_thread = None
+        if worker is None or thread is None:
+            return
+
+        worker.stop()
+        # Results still in flight must not reach this dialog
+        for signal in (worker.progress, worker.fileFinished, worker.error):
+            signal.disconnect()
+        worker.finished.disconnect(self.on_batch_finished)
+        if not thread.isRunning():
+            return
+
+        # The worker checks the stop flag between files and a running QThread
+        # must not be destroyed - hand both to a long-lived owner until the
+        # thread ends (worker.finished already quits it)
+        thread.setParent(self.parent() or QApplication.instance())
+        thread._worker = worker
+        thread.finished.connect(thread.deleteLater)
+        if not thread.isRunning():
+            thread.deleteLater()  # Ended before the connection was made
+
     def closeEvent(self, event):
         """Handle dialog close - cleanup worker."""
-        if self._batch_worker:
-            self._batch_worker.stop()
-            self._batch_worker = None
+        self._cleanup_batch_thread()
         super().closeEvent(event)
 
     def reject(self):
         """Handle dialog reject (ESC or close button) - cleanup worker."""
-        if self._batch_worker:
-            self._batch_worker.stop()
-            self._batch_worker = None
+        self._cleanup_batch_thread()
         super().reject()
 
 
@@ -1379,6 +1516,16 @@ class SettingsDialog(QDialog):
     # Signal emitted when settings are changed and need to be applied
     settingsChanged = Signal()
 
+    # Document mode toggles: (button attribute, label, AppSettings field)
+    DOC_TOGGLES = (
+        ('doc_table_check', "表格识别", 'doc_use_table_recognition'),
+        ('doc_formula_check', "公式识别 (LaTeX)", 'doc_use_formula_recognition'),
+        ('doc_seal_check', "印章识别", 'doc_use_seal_recognition'),
+        ('doc_chart_check', "图表识别", 'doc_use_chart_recognition'),
+        ('doc_orientation_check', "文档方向校正", 'doc_use_doc_orientation'),
+        ('doc_unwarping_check', "文档弯曲矫正", 'doc_use_doc_unwarping'),
+    )
+
     def __init__(self, settings_manager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
@@ -1507,19 +1654,21 @@ class SettingsDialog(QDialog):
         behavior_layout = QVBoxLayout(behavior_group)
         behavior_layout.setSpacing(8)
 
+        toggle_style = self._get_toggle_style()
+
         self.auto_copy_check = QPushButton("OCR 完成后自动复制到剪贴板")
         self.auto_copy_check.setCheckable(True)
-        self.auto_copy_check.setStyleSheet(self._get_toggle_style())
+        self.auto_copy_check.setStyleSheet(toggle_style)
         behavior_layout.addWidget(self.auto_copy_check)
 
         self.show_notification_check = QPushButton("OCR 完成后显示通知")
         self.show_notification_check.setCheckable(True)
-        self.show_notification_check.setStyleSheet(self._get_toggle_style())
+        self.show_notification_check.setStyleSheet(toggle_style)
         behavior_layout.addWidget(self.show_notification_check)
 
         self.minimize_to_tray_check = QPushButton("关闭时最小化到托盘")
         self.minimize_to_tray_check.setCheckable(True)
-        self.minimize_to_tray_check.setStyleSheet(self._get_toggle_style())
+        self.minimize_to_tray_check.setStyleSheet(toggle_style)
         behavior_layout.addWidget(self.minimize_to_tray_check)
 
         layout.addWidget(behavior_group)
@@ -1530,35 +1679,12 @@ class SettingsDialog(QDialog):
         doc_layout.setSpacing(8)
 
         # Document mode options
-        self.doc_table_check = QPushButton("表格识别")
-        self.doc_table_check.setCheckable(True)
-        self.doc_table_check.setStyleSheet(self._get_toggle_style())
-        doc_layout.addWidget(self.doc_table_check)
-
-        self.doc_formula_check = QPushButton("公式识别 (LaTeX)")
-        self.doc_formula_check.setCheckable(True)
-        self.doc_formula_check.setStyleSheet(self._get_toggle_style())
-        doc_layout.addWidget(self.doc_formula_check)
-
-        self.doc_seal_check = QPushButton("印章识别")
-        self.doc_seal_check.setCheckable(True)
-        self.doc_seal_check.setStyleSheet(self._get_toggle_style())
-        doc_layout.addWidget(self.doc_seal_check)
-
-        self.doc_chart_check = QPushButton("图表识别")
-        self.doc_chart_check.setCheckable(True)
-        self.doc_chart_check.setStyleSheet(self._get_toggle_style())
-        doc_layout.addWidget(self.doc_chart_check)
-
-        self.doc_orientation_check = QPushButton("文档方向校正")
-        self.doc_orientation_check.setCheckable(True)
-        self.doc_orientation_check.setStyleSheet(self._get_toggle_style())
-        doc_layout.addWidget(self.doc_orientation_check)
-
-        self.doc_unwarping_check = QPushButton("文档弯曲矫正")
-        self.doc_unwarping_check.setCheckable(True)
-        self.doc_unwarping_check.setStyleSheet(self._get_toggle_style())
-        doc_layout.addWidget(self.doc_unwarping_check)
+        for attr, label, _ in self.DOC_TOGGLES:
+            toggle = QPushButton(label)
+            toggle.setCheckable(True)
+            toggle.setStyleSheet(toggle_style)
+            doc_layout.addWidget(toggle)
+            setattr(self, attr, toggle)
 
         # Info label
         doc_info_label = QLabel("启用更多功能会增加加载时间")
@@ -1635,16 +1761,11 @@ class SettingsDialog(QDialog):
         self.minimize_to_tray_check.setChecked(settings.minimize_to_tray)
 
         # Document Mode
-        self.doc_table_check.setChecked(settings.doc_use_table_recognition)
-        self.doc_formula_check.setChecked(settings.doc_use_formula_recognition)
-        self.doc_seal_check.setChecked(settings.doc_use_seal_recognition)
-        self.doc_chart_check.setChecked(settings.doc_use_chart_recognition)
-        self.doc_orientation_check.setChecked(settings.doc_use_doc_orientation)
-        self.doc_unwarping_check.setChecked(settings.doc_use_doc_unwarping)
+        for attr, _, field in self.DOC_TOGGLES:
+            getattr(self, attr).setChecked(getattr(settings, field))
 
     def _open_hotkey_settings(self):
         """Open the advanced hotkey settings dialog."""
-        from hotkey_settings_dialog import HotkeySettingsDialog
         dialog = HotkeySettingsDialog(self.settings_manager, self)
         dialog.hotkeys_changed.connect(self._on_hotkeys_changed)
         dialog.exec()
@@ -1670,12 +1791,8 @@ class SettingsDialog(QDialog):
         settings.minimize_to_tray = self.minimize_to_tray_check.isChecked()
 
         # Document Mode
-        settings.doc_use_table_recognition = self.doc_table_check.isChecked()
-        settings.doc_use_formula_recognition = self.doc_formula_check.isChecked()
-        settings.doc_use_seal_recognition = self.doc_seal_check.isChecked()
-        settings.doc_use_chart_recognition = self.doc_chart_check.isChecked()
-        settings.doc_use_doc_orientation = self.doc_orientation_check.isChecked()
-        settings.doc_use_doc_unwarping = self.doc_unwarping_check.isChecked()
+        for attr, _, field in self.DOC_TOGGLES:
+            setattr(settings, field, getattr(self, attr).isChecked())
 
         # Save to file
         self.settings_manager.save()
@@ -1729,6 +1846,8 @@ class MainWindow(QMainWindow):
         # OCR engine is now lazily initialized on first use
         self._lazy_init_ocr = True
         self.setup_device_combo()
+        # Load the model in the background so the first hotkey OCR doesn't block
+        QTimer.singleShot(0, self._warm_up_ocr_engine)
         # [Task 687] Start vision server for self-testing
         self._start_vision_server()
 
@@ -1767,7 +1886,6 @@ class MainWindow(QMainWindow):
         splitter.addWidget(self.preview_widget)
 
         # Right: OCR result (stacked widget for different modes)
-        from PySide6.QtWidgets import QStackedWidget
         self.result_stack = QStackedWidget()
 
         # Text mode widget
@@ -1941,7 +2059,6 @@ class MainWindow(QMainWindow):
             self.vision_server = create_vision_server(self)
 
             # Start server in background using QTimer
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(100, self._run_vision_server)
 
             logger.info("[MainWindow] Vision server scheduled to start")
@@ -2017,8 +2134,8 @@ class MainWindow(QMainWindow):
         settings = self.settings_manager.settings
 
         # Check if engine exists and language matches
+        # (a warm-starting engine is still loading, recognize*() waits for it)
         if (self.ocr_engine is not None and
-            self.ocr_engine._initialized and
             self.ocr_engine._lang == settings.ocr_language):
             return True
 
@@ -2069,6 +2186,24 @@ class MainWindow(QMainWindow):
         finally:
             self._ocr_initializing = False
 
+    def _warm_up_ocr_engine(self):
+        """Create the OCR engine and start loading its model in the background."""
+        if self.ocr_engine is not None:
+            return
+
+        settings = self.settings_manager.settings
+        try:
+            # Always use CPU (same as ensure_ocr_engine)
+            self.ocr_engine = OCREngine(
+                device_id='cpu',
+                lang=settings.ocr_language,
+                model_type=settings.ocr_model,
+                warm_start=True
+            )
+        except Exception as e:
+            logger.warning(f"OCR engine warm start skipped: {e}")
+            self.ocr_engine = None
+
     def setup_ocr_engine(self):
         """Initialize the OCR engine (deprecated, use ensure_ocr_engine)."""
         return self.ensure_ocr_engine()
@@ -2169,8 +2304,6 @@ class MainWindow(QMainWindow):
 
     def copy_markdown(self):
         """Copy markdown result to clipboard."""
-        from PySide6.QtWidgets import QApplication
-
         text = self.document_widget.get_markdown()
         if text:
             clipboard = QApplication.clipboard()
@@ -2179,8 +2312,6 @@ class MainWindow(QMainWindow):
 
     def export_markdown(self):
         """Export markdown result to file."""
-        from PySide6.QtWidgets import QFileDialog
-
         text = self.document_widget.get_markdown()
         if not text:
             QMessageBox.warning(self, "警告", "没有可导出的 Markdown 内容")
@@ -2214,7 +2345,6 @@ class MainWindow(QMainWindow):
         self.hide()
 
         # Start overlay after a short delay to ensure window is hidden
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(100, self._screenshot_overlay.start)
 
     def _on_screenshot_captured(self, pixmap):
@@ -2248,7 +2378,6 @@ class MainWindow(QMainWindow):
                 if self._ocr_initializing:
                     self.time_label.setText("等待 OCR 引擎初始化...")
                     # Retry after a short delay
-                    from PySide6.QtCore import QTimer
                     QTimer.singleShot(500, lambda: self._process_pixmap(pixmap))
                     return
                 else:
@@ -2307,10 +2436,11 @@ class MainWindow(QMainWindow):
         # Start the thread
         self._ocr_thread.start()
 
-    def _on_ocr_finished(self, result_text, elapsed, confidence_items):
+    def _on_ocr_finished(self, result, elapsed):
         """Handle OCR completion."""
         # Store confidence items
-        self.result_widget.set_confidence_items(confidence_items)
+        self.result_widget.set_result(result)
+        result_text = result.text
 
         self.time_label.setText(f"OCR 完成，耗时 {elapsed:.2f} 秒")
 
@@ -2373,8 +2503,6 @@ class MainWindow(QMainWindow):
 
     def open_image(self):
         """Open an image file for OCR."""
-        from PySide6.QtWidgets import QFileDialog
-
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "打开图片",
@@ -2395,7 +2523,6 @@ class MainWindow(QMainWindow):
                 if self._ocr_initializing:
                     self.time_label.setText("等待 OCR 引擎初始化...")
                     # Retry after a short delay
-                    from PySide6.QtCore import QTimer
                     QTimer.singleShot(500, lambda: self.process_image(image_path))
                     return
                 else:
@@ -2426,8 +2553,6 @@ class MainWindow(QMainWindow):
 
     def copy_result(self):
         """Copy OCR result to clipboard."""
-        from PySide6.QtWidgets import QApplication
-
         text = self.result_widget.get_text()
 
         if text:
@@ -2446,6 +2571,7 @@ class MainWindow(QMainWindow):
     def show_history(self):
         """Show history dialog."""
         dialog = HistoryDialog(self.history_manager, self)
+        dialog.recordsDeleted.connect(self._on_history_deleted)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # User selected a record to restore
             record = dialog.selected_record
@@ -2453,6 +2579,13 @@ class MainWindow(QMainWindow):
                 self.result_widget.set_text(record.text)
                 self.time_label.setText(f"从历史记录恢复 ({record.timestamp})")
 
+    def _on_history_deleted(self):
+        """Drop cached OCR results - deleted history text must not stay on disk."""
+        if self.ocr_engine is not None:
+            self.ocr_engine.clear_result_cache()
+        else:
+            threading.Thread(target=OCREngine.clear_disk_cache, daemon=True).start()
+
     def show_settings(self):
         """Show settings dialog."""
         dialog = SettingsDialog(self.settings_manager, self)
@@ -2466,7 +2599,6 @@ class MainWindow(QMainWindow):
             if self._ocr_initializing:
                 self.time_label.setText("等待 OCR 引擎初始化...")
                 # Retry after a short delay
-                from PySide6.QtCore import QTimer
                 QTimer.singleShot(500, self.show_batch_dialog)
                 return
             else:
@@ -8,8 +8,89 @@ Supports PaddleOCR 3.0 + PP-OCRv5
 
 import os
 import sys
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
 from typing import List, Tuple, Optional, Any
 
+try:
+    import numpy as np
+except ImportError:  # numpy ships with paddle; only missing in broken installs
+    np = None
+
+# isinstance() target for numpy arrays; empty (matches nothing) without numpy
+_ARRAY_TYPES = (np.ndarray,) if np is not None else ()
+
+# Sentinel for getattr() lookups where None is a meaningful value
+_MISSING = object()
+
+# PIL.Image, imported on first use (see _get_pil_image)
+_pil_image = None
+
+
+def _get_pil_image():
+    """Import PIL.Image once."""
+    global _pil_image
+    if _pil_image is None:
+        from PIL import Image
+        _pil_image = Image
+    return _pil_image
+
+
+# Loaded models shared by every OCREngine, so rebuilding an engine after a
+# settings change doesn't reload weights. Kept small - each holds 100s of MB.
+_PPOCR_CACHE_SIZE = 2
+_STRUCTURE_CACHE_SIZE = 1
+_ppocr_cache = OrderedDict()  # (lang, device_id, use_angle_cls, rec_batch_num) -> PaddleOCR
+_structure_cache = OrderedDict()  # (lang, doc settings) -> PPStructureV3
+_model_cache_lock = threading.Lock()  # Guards the caches and _model_build_locks; held briefly
+_model_build_locks = {}  # (cache id, key) -> Lock held while that model loads
+
+
+def _get_cached_model(cache: OrderedDict, max_size: int, key: tuple, factory) -> Any:
+    """Return the cached model for key, building it with factory() on a miss.
+
+    Only callers wanting the same model wait for its load; other keys
+    stay available meanwhile.
+    """
+    build_key = (id(cache), key)
+    with _model_cache_lock:
+        model = cache.get(key)
+        if model is not None:
+            cache.move_to_end(key)
+            return model
+        build_lock = _model_build_locks.setdefault(build_key, threading.Lock())
+
+    with build_lock:
+        # Another caller may have built it while we waited
+        with _model_cache_lock:
+            model = cache.get(key)
+            if model is not None:
+                cache.move_to_end(key)
+                return model
+        try:
+            model = factory()
+        finally:
+            with _model_cache_lock:
+                _model_build_locks.pop(build_key, None)
+        with _model_cache_lock:
+            cache[key] = model
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+        return model
+
+
+def _evict_cached_model(cache: OrderedDict, key: Optional[tuple]):
+    """Drop a model from its cache so its weights can be freed."""
+    if key is None:
+        return
+    with _model_cache_lock:
+        cache.pop(key, None)
+
+
 # 注意: os.environ 对 PaddlePaddle 3.x 无效
 # 必须在 import paddle 之后使用 paddle.set_flags() 设置
 # 见 _ensure_initialized() 方法中的 _setup_paddle_flags() 调用
@@ -33,6 +114,41 @@ def _setup_paddle_flags():
         pass  # Ignore errors, will be handled elsewhere
 
 
+@lru_cache(maxsize=None)
+def _is_major_version_3_or_higher(version: str) -> bool:
+    """Parse the major number of a PaddleOCR version string (e.g. "3.0.1", "3.0-vl")."""
+    try:
+        return int(version.split('.')[0]) >= 3
+    except (ValueError, IndexError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _paddle_version_info() -> dict:
+    """Installed PaddleOCR/PaddlePaddle versions - fixed for the process lifetime."""
+    info = {
+        'paddleocr_version': 'unknown',
+        'paddlepaddle_version': 'unknown',
+        'is_v3_or_higher': False
+    }
+
+    try:
+        import paddleocr as paddleocr_module
+        info['paddleocr_version'] = getattr(paddleocr_module, '__version__', 'unknown')
+        # Check version directly from module
+        info['is_v3_or_higher'] = _is_major_version_3_or_higher(str(info['paddleocr_version']))
+    except Exception:
+        pass
+
+    try:
+        import paddle
+        info['paddlepaddle_version'] = getattr(paddle, '__version__', 'unknown')
+    except Exception:
+        pass
+
+    return info
+
+
 class OCREngine:
     """
     OCR Engine wrapper for PaddleOCR.
@@ -40,7 +156,28 @@ class OCREngine:
     Compatible with PaddleOCR 3.0 + PP-OCRv5
     """
 
-    def __init__(self, device_id: str = "cpu", lang: str = "ch", model_type: str = "pp-ocrv5"):
+    # Fixed attribute layout - no per-instance __dict__
+    __slots__ = (
+        '_device_id', '_use_gpu', '_gpu_id', '_lang', '_model_type',
+        '_use_angle_cls', '_rec_batch_num',
+        '_ocr', '_predict', '_paddle', '_initialized', '_init_lock',
+        '_ocr_version', '_vl_pipeline', '_vl_accepts_ndarray',
+        '_structure_engine', '_device_name_cache', '_gpu_name_cache',
+        '_result_cache', '_result_cache_lock', '_result_cache_dir',
+        '_state_lock', '_generation', '_closed', '_init_error',
+        '_ppocr_key', '_structure_key',
+    )
+
+    # Device topology doesn't change at runtime - enumerate once per process
+    _devices_cache: Optional[List[Tuple[str, str]]] = None
+
+    RESULT_CACHE_SIZE = 64  # In-memory OCR results kept per engine
+    PERSISTED_RESULT_KINDS = ('text', 'confidence')  # JSON-serializable kinds saved to disk
+    DISK_CACHE_MAX_ENTRIES = 5000  # On-disk results kept across sessions, oldest use evicted
+
+    def __init__(self, device_id: str = "cpu", lang: str = "ch", model_type: str = "pp-ocrv5",
+                 warm_start: bool = False, use_angle_cls: bool = False,
+                 rec_batch_num: int = 1):
         """
         Initialize OCR engine.
 
@@ -48,25 +185,91 @@ class OCREngine:
             device_id: Device identifier ("cpu", "gpu:0", "gpu:1", etc.)
             lang: OCR language ("ch", "en", "cht", "japan", "korean", etc.)
             model_type: OCR model type ("pp-ocrv5", "paddleocr-vl")
+            warm_start: Load the model in a background thread right away
+                        instead of on the first OCR call
+            use_angle_cls: Run the text-angle classifier on each detected box
+                           (PaddleOCR 2.x only; screen text is rarely rotated)
+            rec_batch_num: Text recognition batch size. Batching doesn't help
+                           on CPU but grows the inference memory arena;
+                           raise it for GPU throughput
         """
         self._device_id = device_id
+        self._use_gpu, self._gpu_id = self._parse_device(device_id)
         self._lang = lang
         self._model_type = model_type
+        self._use_angle_cls = use_angle_cls
+        self._rec_batch_num = rec_batch_num
         self._ocr = None
+        self._predict = None  # Bound PP-OCR inference call, see _init_ppocr_model()
         self._paddle = None
         self._initialized = False
         self._ocr_version = None
         self._vl_pipeline = None  # For PaddleOCR-VL-1.5
-        self._structure_engine = None  # For PP-StructureV3 (cached)
-        self._structure_settings = None  # Cached structure settings
-
-        # Lazy initialization - don't load heavy modules until needed
+        self._vl_accepts_ndarray = True  # Cleared if the VL pipeline rejects in-memory arrays
+        self._structure_engine = None  # PP-StructureV3 in use (shared via _structure_cache)
+        self._ppocr_key = None  # _ppocr_cache key of the last PP-OCR model loaded
+        self._structure_key = None  # _structure_cache key of _structure_engine
+        self._device_name_cache = None  # Cached get_current_device_name() result
+        self._gpu_name_cache = {}  # gpu_id -> CUDA device name, survives set_device()
+        self._result_cache = OrderedDict()  # (kind, image digest) -> OCR result, LRU order
+        self._result_cache_lock = threading.Lock()  # OCR and batch threads share the engine
+        self._result_cache_dir = self._get_result_cache_dir()
+        if self._result_cache_dir:
+            threading.Thread(target=self._prune_result_cache, daemon=True).start()
+        self._init_lock = threading.Lock()  # Serializes model (re)initialization
+        self._state_lock = threading.Lock()  # Guards publishing/dropping models; never held while loading
+        self._generation = 0  # Bumped by settings changes; a load for an older one is discarded
+        self._closed = False  # Set by cleanup()
+        self._init_error = None  # (generation, RuntimeError) from a failed warm start
+
+        # Lazy initialization - don't load heavy modules until needed,
+        # unless the caller asked to warm up in the background
+        if warm_start:
+            threading.Thread(target=self._warm_start, daemon=True).start()
+
+    def _warm_start(self):
+        """Initialize the model in the background; a failure is raised on first use."""
+        generation = self._generation
+        try:
+            self._ensure_initialized()
+        except RuntimeError as e:
+            if self._closed:
+                return  # cleanup() during the load, nothing to report
+            print(f"[WARNING] OCR engine warm start failed: {e}")
+            self._init_error = (generation, e)
 
     def _ensure_initialized(self):
-        """Ensure PaddleOCR is initialized."""
+        """Ensure PaddleOCR is initialized for the current settings."""
         if self._initialized:
             return
 
+        # A warm start may be loading the model already - wait for it
+        with self._init_lock:
+            # Report a failed warm start once, then let the next call retry
+            init_error, self._init_error = self._init_error, None
+            if init_error is not None and init_error[0] == self._generation:
+                raise init_error[1]
+
+            # A settings change during the load makes it stale - load again
+            while not self._initialized:
+                if self._closed:
+                    # cleanup() may have run during a load and missed its model
+                    _evict_cached_model(_ppocr_cache, self._ppocr_key)
+                    raise RuntimeError("OCR engine has been shut down")
+                generation = self._generation
+                models = self._load_models()
+                with self._state_lock:
+                    if not self._closed and generation == self._generation:
+                        self._ocr, self._predict, self._vl_pipeline = models
+                        self._initialized = True
+
+    def _load_models(self) -> Tuple[Any, Any, Any]:
+        """
+        Load the model for the current settings.
+
+        Returns:
+            (PaddleOCR, predict callable, VL pipeline) - unused slots are None.
+        """
         try:
             import paddle
             # Setup flags immediately after import, before any paddle operations
@@ -78,11 +281,9 @@ class OCREngine:
 
             # Check if using VL model
             if self._model_type == 'paddleocr-vl':
-                self._init_vl_model()
-            else:
-                self._init_ppocr_model()
-
-            self._initialized = True
+                return None, None, self._init_vl_model()
+            ocr, predict = self._init_ppocr_model()
+            return ocr, predict, None
 
         except ImportError as e:
             raise RuntimeError(
@@ -93,37 +294,59 @@ class OCREngine:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize OCR engine: {e}")
 
-    def _init_ppocr_model(self):
-        """Initialize PP-OCRv5 model."""
+    def _invalidate_model(self):
+        """Mark the loaded model stale so the next OCR call reloads it. Never blocks on a load."""
+        with self._state_lock:
+            self._generation += 1
+            self._initialized = False
+        # The old settings' pipeline isn't coming back - don't keep its weights cached
+        _evict_cached_model(_ppocr_cache, self._ppocr_key)
+
+    def _init_ppocr_model(self) -> Tuple[Any, Any]:
+        """Load the PP-OCRv5 model; returns (PaddleOCR, predict callable)."""
         from paddleocr import PaddleOCR
 
         # Detect PaddleOCR version
         import paddleocr as paddleocr_module
         self._ocr_version = getattr(paddleocr_module, '__version__', '2.x')
-
-        use_gpu = self._device_id.startswith("gpu")
-        gpu_id = 0
-        if use_gpu and ":" in self._device_id:
-            gpu_id = int(self._device_id.split(":")[1])
+        is_v3 = self._is_version_3_or_higher()
 
         # Check if PaddleOCR 3.0+ (PP-OCRv5)
-        if self._is_version_3_or_higher():
+        if is_v3:
             # PaddleOCR 3.0+ API - uses PP-OCRv5 model by default
             # Note: use_gpu and show_log parameters removed in 3.0+
             # device is set via paddle.set_device()
-            self._ocr = PaddleOCR(lang=self._lang)
+            factory = partial(
+                PaddleOCR,
+                lang=self._lang,
+                text_recognition_batch_size=self._rec_batch_num
+            )
         else:
             # PaddleOCR 2.x API (backward compatibility)
-            self._ocr = PaddleOCR(
-                use_angle_cls=True,
+            factory = partial(
+                PaddleOCR,
+                use_angle_cls=self._use_angle_cls,
+                rec_batch_num=self._rec_batch_num,
                 lang=self._lang,
-                use_gpu=use_gpu,
-                gpu_id=gpu_id,
+                use_gpu=self._use_gpu,
+                gpu_id=self._gpu_id,
                 show_log=False
             )
 
-    def _init_vl_model(self):
-        """Initialize PaddleOCR-VL-1.5 vision-language model."""
+        # Reuse a model another engine already loaded with the same options
+        key = (self._lang, self._device_id, self._use_angle_cls, self._rec_batch_num)
+        self._ppocr_key = key
+        ocr = _get_cached_model(_ppocr_cache, _PPOCR_CACHE_SIZE, key, factory)
+
+        # Pick the inference API once instead of probing on every call
+        if is_v3 and hasattr(ocr, 'predict'):
+            # PaddleOCR 3.0+ uses predict() method
+            return ocr, ocr.predict
+        # PaddleOCR 2.x uses ocr() method
+        return ocr, partial(ocr.ocr, cls=self._use_angle_cls)
+
+    def _init_vl_model(self) -> Any:
+        """Load the PaddleOCR-VL-1.5 vision-language model and return its pipeline."""
         try:
             from paddleocr import PaddleOCRVL
         except ImportError:
@@ -132,27 +355,205 @@ class OCREngine:
                 "Please install PaddleOCR 3.0+: pip install 'paddleocr>=3.0'"
             )
 
-        use_gpu = self._device_id.startswith("gpu")
-
         # Initialize VL model with 0.9B parameters
-        self._vl_pipeline = PaddleOCRVL(
-            use_gpu=use_gpu,
-            device=self._device_id if use_gpu else "cpu",
+        pipeline = PaddleOCRVL(
+            use_gpu=self._use_gpu,
+            device=self._device_id if self._use_gpu else "cpu",
             lang=self._lang,
             show_log=False
         )
         self._ocr_version = "3.0-vl"
+        self._vl_accepts_ndarray = True
+        return pipeline
 
     def _is_version_3_or_higher(self) -> bool:
         """Check if PaddleOCR version is 3.0 or higher."""
         if self._ocr_version is None:
             return False
+        return _is_major_version_3_or_higher(str(self._ocr_version))
+
+    def _to_ocr_input(self, image_input: Any) -> Any:
+        """
+        Normalize an image input for PaddleOCR.
+
+        Args:
+            image_input: Image path (str), PIL Image, or numpy array.
+
+        Returns:
+            The file path, or an RGB numpy array.
+        """
+        if isinstance(image_input, str):
+            # File path - not stat'ed here; the first open (cache key or
+            # predict) reports a missing file
+            return image_input
+        if isinstance(image_input, _get_pil_image().Image):
+            # PIL Image - convert to numpy array
+            return self._pil_to_array(image_input)
+        # Assume numpy array
+        return image_input
+
+    def _image_digest(self, img: Any) -> Optional[str]:
+        """
+        Content hash of a normalized OCR input, used as the result cache key.
+
+        Args:
+            img: File path (str) or numpy array, as returned by _to_ocr_input().
+
+        Returns:
+            Hex digest, or None if the input can't be hashed.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        # Results depend on the model and language, not just the pixels
+        h.update(f"{self._model_type}|{self._lang}|{self._use_angle_cls}|".encode('utf-8'))
         try:
-            version_parts = str(self._ocr_version).split('.')
-            major_version = int(version_parts[0])
-            return major_version >= 3
-        except (ValueError, IndexError):
-            return False
+            if isinstance(img, str):
+                # Hash file contents - screenshots reuse the same temp path
+                with open(img, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        h.update(chunk)
+            elif hasattr(img, 'tobytes') and hasattr(img, 'shape'):
+                h.update(str(img.shape).encode('ascii'))
+                h.update(img.tobytes())
+            else:
+                return None
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Image not found: {img}") from e
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    def _clear_result_cache(self):
+        """Drop cached OCR results (in memory) after a model/language/device change."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def clear_result_cache(self):
+        """Forget every cached OCR result, in memory and on disk (e.g. history was deleted)."""
+        self._clear_result_cache()
+        # Up to DISK_CACHE_MAX_ENTRIES files - don't block the caller
+        threading.Thread(target=self.clear_disk_cache, daemon=True).start()
+
+    @classmethod
+    def clear_disk_cache(cls):
+        """Delete all persisted OCR results."""
+        cache_dir = cls._get_result_cache_dir()
+        if not cache_dir:
+            return
+        try:
+            with os.scandir(cache_dir) as it:
+                paths = [e.path for e in it if e.name.endswith('.json') and e.is_file()]
+        except OSError:
+            return
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _get_cached_result(self, kind: str, digest: Optional[str]) -> Any:
+        """Look up a cached OCR result in memory, then on disk. Returns None on miss."""
+        if digest is None:
+            return None
+
+        key = (kind, digest)
+        with self._result_cache_lock:
+            value = self._result_cache.get(key)
+            if value is not None:
+                self._result_cache.move_to_end(key)
+        if value is not None:
+            return list(value) if isinstance(value, list) else value
+
+        if kind not in self.PERSISTED_RESULT_KINDS or not self._result_cache_dir:
+            return None
+
+        path = self._result_cache_path(kind, digest)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)  # mtime tracks last use for _prune_result_cache()
+        except (OSError, ValueError):
+            return None
+
+        if kind == 'confidence':
+            value = [(text, float(score)) for text, score in value]
+        self._remember_result(key, value)
+        return list(value) if isinstance(value, list) else value
+
+    def _store_cached_result(self, kind: str, digest: Optional[str], value: Any):
+        """Cache an OCR result in memory and, for JSON-friendly kinds, on disk."""
+        if digest is None:
+            return
+
+        self._remember_result((kind, digest), list(value) if isinstance(value, list) else value)
+
+        if kind not in self.PERSISTED_RESULT_KINDS or not self._result_cache_dir:
+            return
+
+        try:
+            with open(self._result_cache_path(kind, digest), 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[WARNING] Failed to save OCR cache entry: {e}")
+
+    def _remember_result(self, key: tuple, value: Any):
+        """Insert into the in-memory LRU cache, evicting the oldest entries."""
+        with self._result_cache_lock:
+            self._result_cache[key] = value
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _prune_result_cache(self):
+        """Delete the least recently used on-disk results beyond DISK_CACHE_MAX_ENTRIES."""
+        try:
+            with os.scandir(self._result_cache_dir) as it:
+                entries = [(e.stat().st_mtime, e.path) for e in it
+                           if e.name.endswith('.json') and e.is_file()]
+        except OSError:
+            return
+
+        excess = len(entries) - self.DISK_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _result_cache_path(self, kind: str, digest: str) -> str:
+        """Get the on-disk cache file for a result."""
+        return os.path.join(self._result_cache_dir, f"{kind}_{digest}.json")
+
+    @staticmethod
+    def _get_result_cache_dir() -> Optional[str]:
+        """Get (and create) the OCR result cache directory, or None if unavailable."""
+        if os.name == 'nt':
+            base_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+            cache_dir = os.path.join(base_dir, 'ScreenOCR', 'ocr_cache')
+        else:
+            cache_dir = os.path.expanduser('~/.cache/ScreenOCR/ocr_cache')
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError:
+            return None
+        return cache_dir
+
+    @staticmethod
+    def _rgb_to_bgr(img: Any) -> Any:
+        """Swap RGB to BGR (cv2 channel order) with one contiguous copy."""
+        return np.ascontiguousarray(img[..., ::-1])
+
+    @staticmethod
+    def _pil_to_array(image) -> Any:
+        """Convert a PIL Image to an RGB numpy array (read-only view for RGB input)."""
+        if np is None:
+            raise RuntimeError("numpy is required to run OCR on PIL images: pip install numpy")
+        # Only convert (and copy) when the mode actually differs
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return np.asarray(image)
 
     def get_available_devices(self) -> List[Tuple[str, str]]:
         """
@@ -161,8 +562,16 @@ class OCREngine:
         Returns:
             List of (display_name, device_id) tuples.
         """
+        if OCREngine._devices_cache is not None:
+            return list(OCREngine._devices_cache)
+
         devices = [("CPU", "cpu")]
 
+        # GPUs explicitly hidden - skip importing paddle and touching the CUDA driver
+        if os.environ.get('CUDA_VISIBLE_DEVICES') == '':
+            OCREngine._devices_cache = devices
+            return list(devices)
+
         try:
             import paddle
 
@@ -171,6 +580,8 @@ class OCREngine:
                 for i in range(gpu_count):
                     try:
                         name = paddle.device.cuda.get_device_name(i)
+                        # Reused by get_current_device_name()
+                        self._gpu_name_cache[i] = name
                         devices.append((f"GPU {i}: {name}", f"gpu:{i}"))
                     except Exception:
                         devices.append((f"GPU {i}", f"gpu:{i}"))
@@ -178,8 +589,11 @@ class OCREngine:
             pass
         except Exception as e:
             print(f"[WARNING] Failed to detect GPU devices: {e}")
+            # Don't cache a failed probe
+            return devices
 
-        return devices
+        OCREngine._devices_cache = devices
+        return list(devices)
 
     def set_device(self, device_id: str):
         """
@@ -190,9 +604,11 @@ class OCREngine:
         """
         if device_id != self._device_id:
             self._device_id = device_id
+            self._use_gpu, self._gpu_id = self._parse_device(device_id)
+            self._device_name_cache = None
+            self._clear_result_cache()
             # Force re-initialization on next use
-            self._initialized = False
-            self._ocr = None
+            self._invalidate_model()
 
     def set_language(self, lang: str):
         """
@@ -203,10 +619,9 @@ class OCREngine:
         """
         if lang != self._lang:
             self._lang = lang
+            self._clear_result_cache()
             # Force re-initialization on next use
-            self._initialized = False
-            self._ocr = None
-            self._vl_pipeline = None
+            self._invalidate_model()
 
     def set_model_type(self, model_type: str):
         """
@@ -217,24 +632,47 @@ class OCREngine:
         """
         if model_type != self._model_type:
             self._model_type = model_type
+            self._clear_result_cache()
             # Force re-initialization on next use
-            self._initialized = False
-            self._ocr = None
-            self._vl_pipeline = None
+            self._invalidate_model()
+
+    @staticmethod
+    def _parse_device(device_id: str) -> Tuple[bool, int]:
+        """
+        Split a device identifier into its GPU flag and index.
+
+        Args:
+            device_id: Device identifier ("cpu", "gpu:0", etc.)
+
+        Returns:
+            (use_gpu, gpu_id) tuple; gpu_id is 0 for CPU or a bare "gpu".
+        """
+        use_gpu = device_id.startswith("gpu")
+        gpu_id = 0
+        if use_gpu and ":" in device_id:
+            gpu_id = int(device_id.split(":")[1])
+        return use_gpu, gpu_id
 
     def get_current_device_name(self) -> str:
         """Get the display name of current device."""
+        if self._device_name_cache is None:
+            self._device_name_cache = self._query_device_name()
+        return self._device_name_cache
+
+    def _query_device_name(self) -> str:
+        """Look up the display name of current device."""
         if self._device_id == "cpu":
             return "CPU"
 
-        if self._device_id.startswith("gpu"):
+        if self._use_gpu:
+            gpu_id = self._gpu_id
             try:
                 import paddle
-                if ":" in self._device_id:
-                    gpu_id = int(self._device_id.split(":")[1])
-                else:
-                    gpu_id = 0
-                name = paddle.device.cuda.get_device_name(gpu_id)
+                name = self._gpu_name_cache.get(gpu_id)
+                if name is None:
+                    # CUDA driver round-trip - only once per GPU
+                    name = paddle.device.cuda.get_device_name(gpu_id)
+                    self._gpu_name_cache[gpu_id] = name
                 return f"GPU {gpu_id}: {name}"
             except Exception:
                 return self._device_id.upper()
@@ -253,38 +691,22 @@ class OCREngine:
         """
         self._ensure_initialized()
 
-        # Convert input to path or array
-        if isinstance(image_input, str):
-            # File path
-            if not os.path.exists(image_input):
-                raise FileNotFoundError(f"Image not found: {image_input}")
-            img = image_input
-        elif hasattr(image_input, 'convert'):
-            # PIL Image - convert to numpy array
-            import numpy as np
-            img = np.array(image_input.convert('RGB'))
-        else:
-            # Assume numpy array
-            img = image_input
+        img = self._to_ocr_input(image_input)
+        digest = self._image_digest(img)
+        cached = self._get_cached_result('text', digest)
+        if cached is not None:
+            return cached
 
         # Use VL model if selected
         if self._model_type == 'paddleocr-vl' and self._vl_pipeline is not None:
-            return self._recognize_vl(img)
-
-        # Run OCR using the appropriate API
-        if self._is_version_3_or_higher():
-            # PaddleOCR 3.0+ uses predict() method
-            try:
-                result = self._ocr.predict(img)
-            except Exception:
-                # Fallback to ocr() if predict fails
-                result = self._ocr.ocr(img, cls=True)
+            text = self._recognize_vl(img)
         else:
-            # PaddleOCR 2.x uses ocr() method
-            result = self._ocr.ocr(img, cls=True)
+            result = self._predict(img)
+            # Extract text from result
+            text = self._extract_text(result)
 
-        # Extract text from result
-        return self._extract_text(result)
+        self._store_cached_result('text', digest, text)
+        return text
 
     def _recognize_vl(self, image_input: Any) -> str:
         """
@@ -296,29 +718,48 @@ class OCREngine:
         Returns:
             Recognized text as a single string.
         """
+        return '\n'.join(self._recognize_vl_texts(image_input))
+
+    def _recognize_vl_texts(self, image_input: Any) -> List[str]:
+        """
+        Run PaddleOCR-VL-1.5 and return the text of each result block.
+
+        Args:
+            image_input: Image path (str), PIL Image, or numpy array.
+
+        Returns:
+            List of text blocks (a block may span several lines).
+        """
+        img = self._to_ocr_input(image_input)
+
         # Convert input to path if needed
         temp_path = None
-        if isinstance(image_input, str):
-            if not os.path.exists(image_input):
-                raise FileNotFoundError(f"Image not found: {image_input}")
-            img_path = image_input
-        elif hasattr(image_input, 'convert'):
-            # PIL Image - save to temp file
-            import tempfile
-            temp_path = tempfile.mktemp(suffix='.png')
-            image_input.save(temp_path, 'PNG')
-            img_path = temp_path
-        else:
-            # Assume numpy array - save to temp file
-            import tempfile
-            from PIL import Image
-            temp_path = tempfile.mktemp(suffix='.png')
-            Image.fromarray(image_input).save(temp_path, 'PNG')
+        result = None
+        if not isinstance(img, str) and self._vl_accepts_ndarray:
+            # Pass the array straight to the pipeline (cv2/BGR order), no PNG round-trip
+            try:
+                # list() so errors from lazy predict generators surface here
+                result = list(self._vl_pipeline.predict(self._rgb_to_bgr(img)))
+            except (TypeError, ValueError) as e:
+                # Input-type rejection only; model errors (OOM etc.) propagate
+                print(f"[WARNING] VL model rejected in-memory image, using temp file: {e}")
+                self._vl_accepts_ndarray = False
+
+        if isinstance(img, str):
+            img_path = img
+        elif result is None:
+            # Array the pipeline won't take directly - save to temp file
+            # Create-and-open in one step (mktemp is racy); closed before predict
+            # so the pipeline can reopen it on Windows
+            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tf:
+                temp_path = tf.name
+                _get_pil_image().fromarray(img).save(tf, 'PNG')
             img_path = temp_path
 
         try:
             # Run VL model prediction
-            result = self._vl_pipeline.predict(img_path)
+            if result is None:
+                result = self._vl_pipeline.predict(img_path)
 
             # Extract text from VL result
             texts = []
@@ -330,7 +771,7 @@ class OCREngine:
                     if text:
                         texts.append(str(text))
 
-            return '\n'.join(texts)
+            return texts
 
         finally:
             # Cleanup temp file
@@ -352,36 +793,39 @@ class OCREngine:
         """
         self._ensure_initialized()
 
+        img = self._to_ocr_input(image_input)
+        digest = self._image_digest(img)
+        cached = self._get_cached_result('confidence', digest)
+        if cached is not None:
+            return cached
+
         # Use VL model if selected (VL model returns text without confidence)
         if self._model_type == 'paddleocr-vl' and self._vl_pipeline is not None:
-            text = self._recognize_vl(image_input)
             # VL model doesn't provide confidence, return 1.0 for each line
-            return [(line, 1.0) for line in text.split('\n') if line.strip()]
-
-        # Convert input
-        if isinstance(image_input, str):
-            if not os.path.exists(image_input):
-                raise FileNotFoundError(f"Image not found: {image_input}")
-            img = image_input
-        elif hasattr(image_input, 'convert'):
-            import numpy as np
-            img = np.array(image_input.convert('RGB'))
+            items = [
+                (line, 1.0)
+                for text in self._recognize_vl_texts(img)
+                for line in text.split('\n') if line.strip()
+            ]
         else:
-            img = image_input
+            result = self._predict(img)
+            items = self._extract_with_confidence(result)
 
-        # Run OCR using the appropriate API
-        if self._is_version_3_or_higher():
-            # PaddleOCR 3.0+ uses predict() method
-            try:
-                result = self._ocr.predict(img)
-            except Exception:
-                # Fallback to ocr() if predict fails
-                result = self._ocr.ocr(img, cls=True)
-        else:
-            # PaddleOCR 2.x uses ocr() method
-            result = self._ocr.ocr(img, cls=True)
+        self._store_cached_result('confidence', digest, items)
+        return items
 
-        return self._extract_with_confidence(result)
+    @staticmethod
+    def _pad_scores(scores: Any, count: int) -> List[float]:
+        """Return scores as floats, padded with 1.0 so there is one per text."""
+        if hasattr(scores, 'tolist'):
+            # numpy array - converts to Python floats in one call
+            scores = scores.tolist()
+        else:
+            scores = [float(score) for score in scores]
+        missing = count - len(scores)
+        if missing > 0:
+            scores.extend([1.0] * missing)
+        return scores
 
     def _extract_with_confidence(self, result: Any) -> List[Tuple[str, float]]:
         """
@@ -398,27 +842,28 @@ class OCREngine:
         if not result:
             return items
 
+        # Fast path: single page from the new predict API
+        if isinstance(result, list) and len(result) == 1 and isinstance(result[0], dict):
+            texts = result[0].get('rec_texts', [])
+            scores = self._pad_scores(result[0].get('rec_scores', []), len(texts))
+            return list(zip(texts, scores))
+
         if isinstance(result, list):
             for page_result in result:
                 if isinstance(page_result, dict):
                     # New predict API format
                     texts = page_result.get('rec_texts', [])
-                    scores = page_result.get('rec_scores', [])
-
-                    for i, text in enumerate(texts):
-                        score = scores[i] if i < len(scores) else 1.0
-                        items.append((text, float(score)))
+                    scores = self._pad_scores(page_result.get('rec_scores', []), len(texts))
+                    items.extend(zip(texts, scores))
 
                 elif isinstance(page_result, list):
-                    # Old ocr API format
-                    for item in page_result:
-                        if item and len(item) >= 2:
-                            text_info = item[1]
-                            if isinstance(text_info, tuple) and len(text_info) >= 2:
-                                text, score = text_info[0], float(text_info[1])
-                            else:
-                                text, score = str(text_info), 1.0
-                            items.append((text, score))
+                    # Old ocr API format: [[box, (text, confidence)], ...]
+                    items.extend(
+                        (info[0], float(info[1]))
+                        if isinstance(info, tuple) and len(info) >= 2
+                        else (str(info), 1.0)
+                        for info in (item[1] for item in page_result if item and len(item) >= 2)
+                    )
 
         return items
 
@@ -435,6 +880,12 @@ class OCREngine:
         if not result:
             return ""
 
+        # Fast path: single page from the new predict API
+        if isinstance(result, list) and len(result) == 1 and isinstance(result[0], dict):
+            texts = result[0].get('rec_texts')
+            if isinstance(texts, list):
+                return '\n'.join(texts)
+
         lines = []
 
         # Handle different result formats
@@ -451,13 +902,11 @@ class OCREngine:
                             lines.append(str(texts))
                 elif isinstance(page_result, list):
                     # Old ocr API format: [[box, (text, confidence)], ...]
-                    for item in page_result:
-                        if item and len(item) >= 2:
-                            text_info = item[1]
-                            if isinstance(text_info, tuple) and len(text_info) >= 1:
-                                lines.append(text_info[0])
-                            elif isinstance(text_info, str):
-                                lines.append(text_info)
+                    lines.extend(
+                        info if isinstance(info, str) else info[0]
+                        for info in (item[1] for item in page_result if item and len(item) >= 2)
+                        if isinstance(info, str) or (isinstance(info, tuple) and len(info) >= 1)
+                    )
 
         return '\n'.join(lines)
 
@@ -473,30 +922,17 @@ class OCREngine:
         """
         self._ensure_initialized()
 
-        # Convert input
-        if isinstance(image_input, str):
-            if not os.path.exists(image_input):
-                raise FileNotFoundError(f"Image not found: {image_input}")
-            img = image_input
-        elif hasattr(image_input, 'convert'):
-            import numpy as np
-            img = np.array(image_input.convert('RGB'))
-        else:
-            img = image_input
+        img = self._to_ocr_input(image_input)
+        digest = self._image_digest(img)
+        cached = self._get_cached_result('boxes', digest)
+        if cached is not None:
+            return cached
 
-        # Run OCR using the appropriate API
-        if self._is_version_3_or_higher():
-            # PaddleOCR 3.0+ uses predict() method
-            try:
-                result = self._ocr.predict(img)
-            except Exception:
-                # Fallback to ocr() if predict fails
-                result = self._ocr.ocr(img, cls=True)
-        else:
-            # PaddleOCR 2.x uses ocr() method
-            result = self._ocr.ocr(img, cls=True)
+        result = self._predict(img)
+        items = self._extract_with_boxes(result)
 
-        return self._extract_with_boxes(result)
+        self._store_cached_result('boxes', digest, items)
+        return items
 
     def _extract_with_boxes(self, result: Any) -> List[Tuple[List, str, float]]:
         """Extract text with bounding boxes from OCR result."""
@@ -505,45 +941,54 @@ class OCREngine:
         if not result:
             return items
 
+        # Fast path: single page from the new predict API
+        if isinstance(result, list) and len(result) == 1 and isinstance(result[0], dict):
+            boxes = result[0].get('dt_polys', [])
+            texts = result[0].get('rec_texts', [])
+            scores = self._pad_scores(result[0].get('rec_scores', []), len(texts))
+            return list(zip(boxes, texts, scores))
+
         if isinstance(result, list):
             for page_result in result:
                 if isinstance(page_result, dict):
                     # New predict API format
                     boxes = page_result.get('dt_polys', [])
                     texts = page_result.get('rec_texts', [])
-                    scores = page_result.get('rec_scores', [])
-
-                    for i, (box, text) in enumerate(zip(boxes, texts)):
-                        score = scores[i] if i < len(scores) else 1.0
-                        items.append((box, text, score))
+                    scores = self._pad_scores(page_result.get('rec_scores', []), len(texts))
+                    items.extend(zip(boxes, texts, scores))
 
                 elif isinstance(page_result, list):
-                    # Old ocr API format
-                    for item in page_result:
-                        if item and len(item) >= 2:
-                            box = item[0]
-                            text_info = item[1]
-                            if isinstance(text_info, tuple) and len(text_info) >= 2:
-                                text, score = text_info[0], text_info[1]
-                            else:
-                                text, score = str(text_info), 1.0
-                            items.append((box, text, score))
+                    # Old ocr API format: [[box, (text, confidence)], ...]
+                    items.extend(
+                        (box, info[0], info[1])
+                        if isinstance(info, tuple) and len(info) >= 2
+                        else (box, str(info), 1.0)
+                        for box, info in (item[:2] for item in page_result if item and len(item) >= 2)
+                    )
 
         return items
 
     def cleanup(self):
-        """Cleanup resources."""
-        if self._vl_pipeline is not None:
+        """Cleanup resources. A warm start still loading drops its model when done."""
+        with self._state_lock:
+            self._closed = True
+            self._generation += 1
+            self._initialized = False
+            vl_pipeline = self._vl_pipeline
+            self._vl_pipeline = None
+            self._structure_engine = None
+            self._ocr = None
+            self._predict = None
+        if vl_pipeline is not None:
             try:
-                if hasattr(self._vl_pipeline, 'close'):
-                    self._vl_pipeline.close()
+                if hasattr(vl_pipeline, 'close'):
+                    vl_pipeline.close()
             except Exception:
                 pass
-            self._vl_pipeline = None
-        if self._structure_engine is not None:
-            self._structure_engine = None
-        self._ocr = None
-        self._initialized = False
+        # Free this engine's shared models rather than keeping them until exit
+        _evict_cached_model(_ppocr_cache, self._ppocr_key)
+        _evict_cached_model(_structure_cache, self._structure_key)
+        self._clear_result_cache()
 
     def recognize_document(self, image_input: Any, doc_settings: dict = None) -> str:
         """
@@ -584,130 +1029,120 @@ class OCREngine:
             settings.update(doc_settings)
 
         # Convert input to path or array
-        temp_path = None
-        if isinstance(image_input, str):
-            if not os.path.exists(image_input):
-                raise FileNotFoundError(f"Image not found: {image_input}")
-            img_path = image_input
-        elif hasattr(image_input, 'convert'):
-            # PIL Image - convert to numpy array
-            import numpy as np
-            img_array = np.array(image_input.convert('RGB'))
-            img_path = None
-        else:
-            # Assume numpy array
-            img_array = image_input
-            img_path = None
+        img = self._to_ocr_input(image_input)
+
+        # Use cached PP-StructureV3 engine or create new one
+        # (a settings change selects a different cache entry)
+        key = (self._lang, tuple(sorted(settings.items())))
+        self._structure_key = key
+        self._structure_engine = _get_cached_model(
+            _structure_cache, _STRUCTURE_CACHE_SIZE, key,
+            partial(
+                PPStructureV3,
+                lang=self._lang,
+                format_block_content=True,
+                use_table_recognition=settings['use_table_recognition'],
+                use_formula_recognition=settings['use_formula_recognition'],
+                use_seal_recognition=settings['use_seal_recognition'],
+                use_chart_recognition=settings['use_chart_recognition'],
+                use_doc_orientation_classify=settings['use_doc_orientation'],
+                use_doc_unwarping=settings['use_doc_unwarping'],
+            )
+        )
 
-        try:
-            # Check if settings changed - need to recreate engine
-            if self._structure_engine is not None and self._structure_settings != settings:
-                self._structure_engine = None
-
-            # Use cached PP-StructureV3 engine or create new one
-            if self._structure_engine is None:
-                self._structure_engine = PPStructureV3(
-                    lang=self._lang,
-                    format_block_content=True,
-                    use_table_recognition=settings['use_table_recognition'],
-                    use_formula_recognition=settings['use_formula_recognition'],
-                    use_seal_recognition=settings['use_seal_recognition'],
-                    use_chart_recognition=settings['use_chart_recognition'],
-                    use_doc_orientation_classify=settings['use_doc_orientation'],
-                    use_doc_unwarping=settings['use_doc_unwarping'],
-                )
-                self._structure_settings = settings.copy()
-
-            # Run prediction - pass image path directly if available
-            if img_path is not None:
-                output = self._structure_engine.predict(img_path, format_block_content=True)
-            else:
-                # For numpy array, need to use cv2 format (BGR)
-                import cv2
-                img = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        # Run prediction - pass image path directly if available
+        if isinstance(img, str):
+            try:
                 output = self._structure_engine.predict(img, format_block_content=True)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Image not found: {img}") from e
+        else:
+            # For numpy array, need to use cv2 format (BGR)
+            img = self._rgb_to_bgr(img)
+            output = self._structure_engine.predict(img, format_block_content=True)
+
+        # Extract markdown from results
+        markdown_pages = []
+
+        for page_result in output:
+            page_markdown = ''
+
+            # Single getattr per field - hasattr() followed by access would
+            # evaluate result properties (e.g. markdown) twice
+            md_texts = getattr(page_result, 'markdown_texts', None)
+            md_val = None if md_texts else getattr(page_result, 'markdown', _MISSING)
+
+            # First try markdown_texts (direct field on page_result)
+            if md_texts:
+                page_markdown = str(md_texts)
+            # Then try markdown.markdown_texts if markdown is an object
+            elif md_val is not _MISSING:
+                if md_val is not None:
+                    nested_texts = getattr(md_val, 'markdown_texts', None)
+                    if nested_texts:
+                        page_markdown = str(nested_texts)
+                    elif isinstance(md_val, str):
+                        page_markdown = md_val
+                    elif isinstance(md_val, dict) and 'markdown_texts' in md_val:
+                        page_markdown = str(md_val['markdown_texts'])
+            # Dict access
+            elif isinstance(page_result, dict):
+                if 'markdown_texts' in page_result:
+                    page_markdown = str(page_result['markdown_texts'])
+                elif 'markdown' in page_result:
+                    md_val = page_result['markdown']
+                    if isinstance(md_val, dict) and 'markdown_texts' in md_val:
+                        page_markdown = str(md_val['markdown_texts'])
+                    elif isinstance(md_val, str):
+                        page_markdown = md_val
+
+            if page_markdown:
+                markdown_pages.append(page_markdown)
+
+        # Combine pages
+        if markdown_pages:
+            try:
+                return str(self._structure_engine.concatenate_markdown_pages(markdown_pages))
+            except Exception:
+                return '\n\n'.join(markdown_pages)
+        else:
+            return ''
 
-            # Extract markdown from results
-            markdown_pages = []
-
-            for page_result in output:
-                page_markdown = ''
-
-                # First try markdown_texts (direct field on page_result)
-                if hasattr(page_result, 'markdown_texts') and page_result.markdown_texts:
-                    page_markdown = str(page_result.markdown_texts)
-                # Then try markdown.markdown_texts if markdown is an object
-                elif hasattr(page_result, 'markdown'):
-                    md_val = page_result.markdown
-                    if md_val is not None:
-                        if hasattr(md_val, 'markdown_texts') and md_val.markdown_texts:
-                            page_markdown = str(md_val.markdown_texts)
-                        elif isinstance(md_val, str):
-                            page_markdown = md_val
-                        elif isinstance(md_val, dict) and 'markdown_texts' in md_val:
-                            page_markdown = str(md_val['markdown_texts'])
-                # Dict access
-                elif isinstance(page_result, dict):
-                    if 'markdown_texts' in page_result:
-                        page_markdown = str(page_result['markdown_texts'])
-                    elif 'markdown' in page_result:
-                        md_val = page_result['markdown']
-                        if isinstance(md_val, dict) and 'markdown_texts' in md_val:
-                            page_markdown = str(md_val['markdown_texts'])
-                        elif isinstance(md_val, str):
-                            page_markdown = md_val
-
-                if page_markdown:
-                    markdown_pages.append(page_markdown)
-
-            # Combine pages
-            if markdown_pages:
-                try:
-                    return str(self._structure_engine.concatenate_markdown_pages(markdown_pages))
-                except Exception:
-                    return '\n\n'.join(markdown_pages)
-            else:
-                return ''
-
-        finally:
-            # Cleanup temp file
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass
+    # Fields holding recognized text in PP-Structure JSON output
+    _STRUCTURE_TEXT_KEYS = ('text', 'content', 'ocr_text', 'rec_texts')
 
     def _extract_text_from_structure(self, json_data: Any) -> str:
         """Extract plain text from structure JSON data."""
         texts = []
-
-        # Safe check for empty/None data (avoid NumPy array truth value error)
-        if json_data is None:
-            return ''
-
-        # Check for numpy array
-        if hasattr(json_data, 'ndim'):
-            # This is a numpy array, skip it
-            return ''
-
-        # Handle different JSON structures
-        if isinstance(json_data, list):
-            for item in json_data:
-                texts.append(self._extract_text_from_structure(item))
-        elif isinstance(json_data, dict):
-            # Try common text fields
-            for key in ['text', 'content', 'ocr_text', 'rec_texts']:
-                if key in json_data:
-                    value = json_data[key]
-                    if isinstance(value, list):
-                        texts.extend([str(t) for t in value])
-                    elif isinstance(value, str):
-                        texts.append(value)
-
-            # Recursively process nested structures
-            for key, value in json_data.items():
-                if isinstance(value, (dict, list)) and key not in ['text', 'content', 'ocr_text', 'rec_texts']:
-                    texts.append(self._extract_text_from_structure(value))
+        text_keys = self._STRUCTURE_TEXT_KEYS
+
+        # Depth-first walk with an explicit stack (children pushed in
+        # reverse so output keeps document order)
+        stack = [json_data]
+        while stack:
+            node = stack.pop()
+
+            # None and numpy arrays (e.g. images) carry no text
+            if node is None or isinstance(node, _ARRAY_TYPES):
+                continue
+
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+            elif isinstance(node, dict):
+                # Try common text fields
+                for key in text_keys:
+                    if key in node:
+                        value = node[key]
+                        if isinstance(value, list):
+                            texts.extend(str(t) for t in value)
+                        elif isinstance(value, str):
+                            texts.append(value)
+
+                # Queue nested structures
+                stack.extend(reversed([
+                    value for key, value in node.items()
+                    if isinstance(value, (dict, list)) and key not in text_keys
+                ]))
 
         return '\n'.join(filter(None, texts))
 
@@ -718,28 +1153,8 @@ class OCREngine:
         Returns:
             Dictionary with version information.
         """
-        info = {
-            'paddleocr_version': 'unknown',
-            'paddlepaddle_version': 'unknown',
-            'is_v3_or_higher': False
-        }
-
-        try:
-            import paddleocr as paddleocr_module
-            info['paddleocr_version'] = getattr(paddleocr_module, '__version__', 'unknown')
-            # Check version directly from module
-            version_parts = str(info['paddleocr_version']).split('.')
-            info['is_v3_or_higher'] = int(version_parts[0]) >= 3
-        except Exception:
-            pass
-
-        try:
-            import paddle
-            info['paddlepaddle_version'] = getattr(paddle, '__version__', 'unknown')
-        except Exception:
-            pass
-
-        return info
+        # Copy so callers can't mutate the memoized dict
+        return dict(_paddle_version_info())
 
     def get_model_type(self) -> str:
         """Get current OCR model type."""
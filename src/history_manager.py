@@ -5,20 +5,62 @@ ScreenOCR - History Manager
 Manages OCR history records with persistence.
 """
 
+import atexit
+import base64
 import json
 import os
+import threading
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Deque, List, Dict, Optional
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson  # Optional: C-speed JSON encode/decode
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    from PySide6.QtCore import Qt  # Already loaded by the UI; used to scale QPixmap thumbnails
+except ImportError:
+    Qt = None
+
+# PIL.Image, imported on first use (see _get_pil_image) - only needed for
+# PIL thumbnails, so it stays off the startup path
+_pil_image = None
+
+
+def _get_pil_image():
+    """Import PIL.Image once."""
+    global _pil_image
+    if _pil_image is None:
+        from PIL import Image
+        _pil_image = Image
+    return _pil_image
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to compact single-line UTF-8 JSON bytes (one JSONL entry)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)  # No per-instance __dict__
 class HistoryRecord:
-    """Single OCR history record."""
+    """Single OCR history record (read-only view; stored internally as a dict)."""
     id: str
     timestamp: str
     text: str
-    image_thumbnail: Optional[str]  # Base64 encoded thumbnail
+    thumbnail_path: Optional[str]  # JPEG file name in the thumbnails directory
     elapsed_time: float
 
     def to_dict(self) -> Dict:
@@ -34,6 +76,9 @@ class HistoryManager:
 
     MAX_RECORDS = 100  # Maximum number of records to keep
     THUMBNAIL_SIZE = (120, 120)  # Thumbnail dimensions
+    THUMBNAIL_QUALITY = 60  # JPEG quality for thumbnails
+    COMPACT_THRESHOLD = MAX_RECORDS // 4  # Stale lines tolerated before rewriting the log
+    SAVE_DELAY = 0.5  # Seconds to coalesce bursts of changes into one background write
 
     def __init__(self, storage_dir: Optional[str] = None):
         """Initialize history manager.
@@ -51,34 +96,183 @@ class HistoryManager:
             storage_dir = os.path.join(base_dir, 'ScreenOCR')
 
         self.storage_dir = storage_dir
-        self.history_file = os.path.join(storage_dir, 'history.json')
-        self._records: List[HistoryRecord] = []
-
-        # Ensure storage directory exists
-        os.makedirs(storage_dir, exist_ok=True)
+        # Append-only log: one record per line, deletions as tombstone lines
+        self.history_file = os.path.join(storage_dir, 'history.jsonl')
+        self._legacy_history_file = os.path.join(storage_dir, 'history.json')
+        self.thumbnail_dir = os.path.join(storage_dir, 'thumbnails')
+        self._records: Deque[Dict] = deque(maxlen=self.MAX_RECORDS)  # Plain dicts, newest first
+        self._id_index: Dict[str, Dict] = {}  # Record ID -> entry in _records
+        self._text_lower: Dict[str, str] = {}  # Record ID -> lowercased text for search (not persisted)
+        self._stale_lines = 0  # Log lines not backing a live record (deleted/trimmed)
+
+        # Writes happen on a timer thread, off the UI thread
+        self._lock = threading.RLock()  # Guards _records and the pending-write state
+        self._io_lock = threading.Lock()  # Serializes writers of history_file
+        self._pending: List[Dict] = []  # Log entries not yet appended
+        self._compact_pending = False
+        self._save_timer: Optional[threading.Timer] = None
+
+        # Ensure storage directories exist
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
 
         # Load existing history
         self._load()
 
+        # Don't lose a debounced write at exit
+        atexit.register(self.flush)
+
     def _load(self):
         """Load history from file."""
-        if os.path.exists(self.history_file):
+        if not os.path.exists(self.history_file):
+            self._load_legacy()
+            return
+
+        records = []  # Oldest first, as written
+        deleted_ids = set()
+        line_count = 0
+        torn = False
+        migrated = False
+        try:
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    line_count += 1
+                    try:
+                        entry = _json_loads(line)
+                    except ValueError:
+                        # Torn last write - skip it and compact below so the
+                        # next append doesn't land on the partial line
+                        torn = True
+                        continue
+                    if not isinstance(entry, dict) or not ('_tombstone' in entry or 'id' in entry):
+                        # A truncated line can still parse (e.g. "123") - skip it too
+                        torn = True
+                        continue
+                    if '_tombstone' in entry:
+                        deleted_ids.add(entry['_tombstone'])
+                    else:
+                        migrated |= self._migrate_thumbnail(entry)
+                        records.append(entry)
+        except Exception as e:
+            print(f"[WARNING] Failed to load history: {e}")
+            self._set_records([])
+            return
+
+        records.reverse()  # Newest first
+        self._set_records([r for r in records if r['id'] not in deleted_ids])
+        self._stale_lines = line_count - len(self._records)
+        if torn or migrated or self._stale_lines > self.COMPACT_THRESHOLD:
+            self._compact()
+
+    def _load_legacy(self):
+        """Import records from the old single-document history.json."""
+        if not os.path.exists(self._legacy_history_file):
+            return
+        try:
+            with open(self._legacy_history_file, 'rb') as f:
+                data = _json_loads(f.read())
+                for entry in data:
+                    self._migrate_thumbnail(entry)
+                self._set_records(data)
+        except Exception as e:
+            print(f"[WARNING] Failed to load history: {e}")
+            self._set_records([])
+            return
+        self._compact()
+
+    def _set_records(self, records: List[Dict]):
+        """Replace the records (newest first, trimmed to MAX_RECORDS) and rebuild the ID index."""
+        self._records = deque(records[:self.MAX_RECORDS], maxlen=self.MAX_RECORDS)
+        self._id_index = {r['id']: r for r in self._records}
+        self._text_lower = {}  # Filled lazily by search()
+
+    def _migrate_thumbnail(self, entry: Dict) -> bool:
+        """Move a legacy inline base64 thumbnail to a file. Returns True if entry changed."""
+        if 'image_thumbnail' not in entry:
+            return False
+
+        thumbnail_b64 = entry.pop('image_thumbnail')
+        entry['thumbnail_path'] = None
+        if thumbnail_b64:
             try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._records = [HistoryRecord.from_dict(r) for r in data]
+                file_name = f"{entry['id']}.jpg"
+                with open(os.path.join(self.thumbnail_dir, file_name), 'wb') as f:
+                    f.write(base64.b64decode(thumbnail_b64))
+                entry['thumbnail_path'] = file_name
             except Exception as e:
-                print(f"[WARNING] Failed to load history: {e}")
-                self._records = []
+                print(f"[WARNING] Failed to migrate thumbnail: {e}")
+        return True
 
-    def _save(self):
-        """Save history to file."""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([r.to_dict() for r in self._records], f,
-                         ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"[WARNING] Failed to save history: {e}")
+    def _remove_thumbnail(self, record: Dict):
+        """Delete a record's thumbnail file, if any."""
+        if record['thumbnail_path']:
+            try:
+                os.remove(os.path.join(self.thumbnail_dir, record['thumbnail_path']))
+            except OSError:
+                pass
+
+    def _append(self, entry: Dict):
+        """Queue one entry (record or tombstone) for appending to the history log."""
+        with self._lock:
+            self._pending.append(entry)
+            self._schedule_save()
+
+    def _compact(self):
+        """Queue a rewrite of the history log with only the live records."""
+        with self._lock:
+            self._compact_pending = True
+            self._stale_lines = 0
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Arm the debounce timer; changes until it fires share one write."""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending history changes to disk now."""
+        with self._io_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                pending, self._pending = self._pending, []
+                compact, self._compact_pending = self._compact_pending, False
+                # Oldest first, so later appends stay in chronological order
+                snapshot = list(reversed(self._records)) if compact else None
+
+            temp_file = self.history_file + '.tmp'
+            try:
+                if compact:
+                    # The snapshot already includes any pending records; write
+                    # it to a temp file and swap it in atomically
+                    with open(temp_file, 'wb') as f:
+                        f.writelines(
+                            _json_dumps(r) + b'\n'
+                            for r in snapshot
+                        )
+                    os.replace(temp_file, self.history_file)
+                elif pending:
+                    with open(self.history_file, 'ab') as f:
+                        f.writelines(
+                            _json_dumps(entry) + b'\n'
+                            for entry in pending
+                        )
+            except Exception as e:
+                print(f"[WARNING] Failed to save history: {e}")
+                if compact:
+                    # The original log is untouched; drop the partial rewrite
+                    try:
+                        os.remove(temp_file)
+                    except OSError:
+                        pass
+                # Rewrite the whole log on the next save - it covers the failed
+                # entries, and any partial append is replaced
+                with self._lock:
+                    self._compact_pending = True
 
     def add_record(self, text: str, image=None, elapsed_time: float = 0.0) -> HistoryRecord:
         """Add a new history record.
@@ -96,74 +290,110 @@ class HistoryManager:
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
         # Generate thumbnail if image provided
-        thumbnail_b64 = None
+        thumbnail_path = None
         if image is not None:
-            thumbnail_b64 = self._create_thumbnail(image)
-
-        record = HistoryRecord(
-            id=record_id,
-            timestamp=timestamp,
-            text=text,
-            image_thumbnail=thumbnail_b64,
-            elapsed_time=elapsed_time
-        )
-
-        # Add to beginning of list (newest first)
-        self._records.insert(0, record)
-
-        # Trim to max records
-        if len(self._records) > self.MAX_RECORDS:
-            self._records = self._records[:self.MAX_RECORDS]
-
-        # Save to file
-        self._save()
-
-        return record
-
-    def _create_thumbnail(self, image) -> Optional[str]:
-        """Create base64 encoded thumbnail from image.
+            thumbnail_path = self._create_thumbnail(image, record_id)
+
+        record = {
+            'id': record_id,
+            'timestamp': timestamp,
+            'text': text,
+            'thumbnail_path': thumbnail_path,
+            'elapsed_time': elapsed_time,
+        }
+
+        with self._lock:
+            # The deque is bounded: at capacity, appendleft drops the oldest
+            # record (its log line stays until compaction)
+            if len(self._records) == self.MAX_RECORDS:
+                old_record = self._records[-1]
+                self._stale_lines += 1
+                self._remove_thumbnail(old_record)
+                del self._id_index[old_record['id']]
+                self._text_lower.pop(old_record['id'], None)
+
+            # Add to beginning (newest first)
+            self._records.appendleft(record)
+            self._id_index[record_id] = record
+            self._text_lower[record_id] = text.lower()
+
+            # Save to file - append only this record
+            self._append(record)
+            if self._stale_lines > self.COMPACT_THRESHOLD:
+                self._compact()
+
+        return HistoryRecord.from_dict(record)
+
+    def _create_thumbnail(self, image, record_id: str) -> Optional[str]:
+        """Create a JPEG thumbnail file for a record.
 
         Args:
             image: PIL Image or QPixmap
+            record_id: Record ID, used as the file name
 
         Returns:
-            Base64 encoded JPEG string or None
+            Thumbnail file name (relative to thumbnail_dir) or None
         """
-        try:
-            import base64
-            from io import BytesIO
+        file_name = f"{record_id}.jpg"
+        file_path = os.path.join(self.thumbnail_dir, file_name)
 
-            # Convert QPixmap to PIL Image if needed
+        try:
             if hasattr(image, 'toImage'):
-                # QPixmap
-                from PySide6.QtCore import QBuffer, QIODevice
-                buffer = QBuffer()
-                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                image.save(buffer, "PNG")
-
-                from PIL import Image
-                img_data = bytes(buffer.data())
-                pil_image = Image.open(BytesIO(img_data))
-            elif hasattr(image, 'thumbnail'):
+                # QPixmap - scale and encode in Qt, no PNG/PIL round-trip
+                width, height = self.THUMBNAIL_SIZE
+                if image.width() > width or image.height() > height:
+                    image = image.scaled(
+                        width, height,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                if not image.save(file_path, "JPEG", self.THUMBNAIL_QUALITY):
+                    print("[WARNING] Failed to create thumbnail: could not save JPEG")
+                    return None
+                return file_name
+
+            if hasattr(image, 'thumbnail'):
                 # Already PIL Image
                 pil_image = image.copy()
             else:
                 return None
 
-            # Create thumbnail
-            pil_image.thumbnail(self.THUMBNAIL_SIZE)
+            # Create thumbnail - bilinear is plenty at 120px, and reducing_gap
+            # lets PIL shrink by an integer factor first
+            pil_image.thumbnail(self.THUMBNAIL_SIZE, _get_pil_image().Resampling.BILINEAR,
+                                reducing_gap=2.0)
+            if pil_image.mode not in ('RGB', 'L'):
+                # JPEG has no alpha channel or palette (RGBA/P images)
+                pil_image = pil_image.convert('RGB')
 
-            # Convert to base64
-            buffer = BytesIO()
-            pil_image.save(buffer, format='JPEG', quality=70)
-            thumbnail_b64 = base64.b64encode(buffer.getvalue()).decode('ascii')
+            # Save next to the history log
+            pil_image.save(file_path, format='JPEG',
+                           quality=self.THUMBNAIL_QUALITY, optimize=True)
 
-            return thumbnail_b64
+            return file_name
 
         except Exception as e:
             print(f"[WARNING] Failed to create thumbnail: {e}")
             return None
 
+    def load_thumbnail(self, record_id: str) -> Optional[bytes]:
+        """Read a record's JPEG thumbnail.
+
+        Args:
+            record_id: Record ID
+
+        Returns:
+            JPEG bytes or None if the record has no thumbnail
+        """
+        record = self._id_index.get(record_id)
+        if record is None or not record['thumbnail_path']:
+            return None
+        try:
+            with open(os.path.join(self.thumbnail_dir, record['thumbnail_path']), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
     def get_records(self, limit: int = 50, offset: int = 0) -> List[HistoryRecord]:
         """Get history records.
 
@@ -174,7 +404,7 @@ class HistoryManager:
         Returns:
             List of HistoryRecord
         """
-        return self._records[offset:offset + limit]
+        return [HistoryRecord.from_dict(r) for r in islice(self._records, offset, offset + limit)]
 
     def get_record_by_id(self, record_id: str) -> Optional[HistoryRecord]:
         """Get a specific record by ID.
@@ -185,10 +415,8 @@ class HistoryManager:
         Returns:
             HistoryRecord or None if not found
         """
-        for record in self._records:
-            if record.id == record_id:
-                return record
-        return None
+        record = self._id_index.get(record_id)
+        return HistoryRecord.from_dict(record) if record is not None else None
 
     def delete_record(self, record_id: str) -> bool:
         """Delete a record by ID.
@@ -199,17 +427,46 @@ class HistoryManager:
         Returns:
             True if deleted, False if not found
         """
-        for i, record in enumerate(self._records):
-            if record.id == record_id:
-                del self._records[i]
-                self._save()
-                return True
-        return False
+        return self.delete_records([record_id]) == 1
+
+    def delete_records(self, record_ids: List[str]) -> int:
+        """Delete several records in one pass.
+
+        Args:
+            record_ids: Record IDs to delete
+
+        Returns:
+            Number of records deleted (unknown IDs are skipped)
+        """
+        with self._lock:
+            removed = set()
+            for record_id in record_ids:
+                record = self._id_index.pop(record_id, None)
+                if record is None:
+                    continue
+                removed.add(record_id)
+                self._text_lower.pop(record_id, None)
+                self._remove_thumbnail(record)
+                self._append({'_tombstone': record_id})
+            if not removed:
+                return 0
+
+            # One rebuild instead of a deque.remove() scan per record
+            self._records = deque((r for r in self._records if r['id'] not in removed),
+                                  maxlen=self.MAX_RECORDS)
+            self._stale_lines += 2 * len(removed)  # Each record's line and its tombstone
+            if self._stale_lines > self.COMPACT_THRESHOLD:
+                self._compact()
+        return len(removed)
 
     def clear_all(self):
         """Clear all history records."""
-        self._records = []
-        self._save()
+        with self._lock:
+            for record in self._records:
+                self._remove_thumbnail(record)
+            self._set_records([])
+            self._compact()
+        self.flush()
 
     def get_count(self) -> int:
         """Get total number of records."""
@@ -226,10 +483,12 @@ class HistoryManager:
             List of matching HistoryRecord
         """
         query_lower = query.lower()
-        results = []
-        for record in self._records:
-            if query_lower in record.text.lower():
-                results.append(record)
-                if len(results) >= limit:
-                    break
-        return results
+        matches = (r for r in self._records if query_lower in self._lowered_text(r))
+        return [HistoryRecord.from_dict(r) for r in islice(matches, limit)]
+
+    def _lowered_text(self, record: Dict) -> str:
+        """Get a record's lowercased text, computing it on first use after a load."""
+        lowered = self._text_lower.get(record['id'])
+        if lowered is None:
+            lowered = self._text_lower[record['id']] = record['text'].lower()
+        return lowered
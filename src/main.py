@@ -33,20 +33,14 @@ _setup_error_logging()
 
 import threading
 
-# Ensure UTF-8 output (only when stdout has buffer attribute, skip if using devnull)
+# Ensure UTF-8 output - reconfigure the existing text streams in place
+# (no-op for the log/devnull files, which are already UTF-8)
 if sys.platform == 'win32':
-    import codecs
-    # Only wrap if stdout has buffer (not devnull file)
-    if sys.stdout is not None and hasattr(sys.stdout, 'buffer') and sys.stdout.buffer is not None:
+    for _stream in (sys.stdout, sys.stderr):
         try:
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
+            _stream.reconfigure(encoding='utf-8')
         except Exception:
-            pass  # Ignore errors, keep current stdout
-    if sys.stderr is not None and hasattr(sys.stderr, 'buffer') and sys.stderr.buffer is not None:
-        try:
-            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
-        except Exception:
-            pass  # Ignore errors, keep current stderr
+            pass  # Not a reconfigurable text stream, keep it as is
 
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from PySide6.QtCore import Qt, QObject, Signal
@@ -84,7 +78,8 @@ class SingleInstanceManager(QObject):
             socket = QLocalSocket()
             socket.connectToServer(SINGLE_INSTANCE_KEY)
 
-            if socket.waitForConnected(500):
+            # Local socket connects are near-instant; don't hold up a cold start
+            if socket.waitForConnected(100):
                 # Another instance is running - send show message
                 socket.write(b"SHOW")
                 socket.waitForBytesWritten(1000)
@@ -100,11 +95,8 @@ class SingleInstanceManager(QObject):
 
             if not self._server.listen(SINGLE_INSTANCE_KEY):
                 print(f"[WARNING] Failed to create single instance server: {self._server.errorString()}")
-                # Try one more time after removing
-                QLocalServer.removeServer(SINGLE_INSTANCE_KEY)
-                if not self._server.listen(SINGLE_INSTANCE_KEY):
-                    print("[WARNING] Single instance check disabled, continuing anyway")
-                    return True  # Continue anyway
+                print("[WARNING] Single instance check disabled, continuing anyway")
+                return True  # Continue anyway
 
             self._server.newConnection.connect(self._on_new_connection)
             self._is_primary = True
@@ -134,80 +126,211 @@ class SingleInstanceManager(QObject):
 
 
 class GlobalHotkeyManager(QObject):
-    """Global hotkey manager using keyboard library."""
+    """Global hotkey manager.
+
+    On Windows, modifier combos are registered with RegisterHotKey, so only
+    the hotkey itself wakes us up rather than every keystroke. Bare keys
+    (e.g. F5) and other platforms use the keyboard library's hook, which
+    lets the key still reach other applications.
+    """
     hotkey_triggered = Signal()
     alt_hotkey_triggered = Signal()  # Alternative screenshot hotkey
 
+    # Win32 RegisterHotKey modifier flags, virtual-key codes and messages
+    _WIN_MODIFIERS = {'alt': 0x0001, 'ctrl': 0x0002, 'shift': 0x0004, 'win': 0x0008}
+    _MOD_NOREPEAT = 0x4000
+    _WIN_VK_CODES = {
+        **{c.lower(): ord(c) for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'},
+        **{f'f{n}': 0x6F + n for n in range(1, 25)},
+        'esc': 0x1B, 'tab': 0x09, 'space': 0x20, 'enter': 0x0D, 'backspace': 0x08,
+        'delete': 0x2E, 'insert': 0x2D, 'home': 0x24, 'end': 0x23,
+        'pageup': 0x21, 'pagedown': 0x22, 'up': 0x26, 'down': 0x28,
+        'left': 0x25, 'right': 0x27, 'print': 0x2C, 'scrolllock': 0x91,
+        'pause': 0x13, 'numlock': 0x90,
+        '`': 0xC0, '-': 0xBD, '=': 0xBB, '[': 0xDB, ']': 0xDD, '\\': 0xDC,
+        ';': 0xBA, "'": 0xDE, ',': 0xBC, '.': 0xBE, '/': 0xBF,
+    }
+    _WM_QUIT = 0x0012
+    _WM_HOTKEY = 0x0312
+
     def __init__(self, hotkey='ctrl+shift+o', alt_hotkey='f5'):
         super().__init__()
         self.hotkey = hotkey
         self.alt_hotkey = alt_hotkey
         self._running = False
         self._enabled = True
-        self._registered_hotkeys = []
+        # Slot ('hotkey' / 'alt_hotkey') -> callable that unregisters it, so a
+        # settings change only re-registers the hotkeys that changed
+        self._registrations = {}
 
     def start(self):
         """Start listening for global hotkey."""
         if not self._enabled:
             return
 
+        for slot in ('hotkey', 'alt_hotkey'):
+            self._register(slot)
+        self._running = True
+
+    def stop(self):
+        """Stop listening for global hotkey."""
+        for slot in list(self._registrations):
+            self._unregister(slot)
+        self._running = False
+
+    def _register(self, slot):
+        """(Re-)register the hotkey held in one slot."""
+        self._unregister(slot)
+
+        if slot == 'hotkey':
+            hotkey, callback, label = self.hotkey, self._on_hotkey, "Global hotkey"
+        else:
+            # The alternative hotkey is skipped if unset or the same as the main one
+            if not self.alt_hotkey or self.alt_hotkey == self.hotkey:
+                return
+            hotkey, callback, label = self.alt_hotkey, self._on_alt_hotkey, "Alternative hotkey"
+
+        parsed = self._parse_win_hotkey(hotkey) if sys.platform == 'win32' else None
+        if parsed is not None:
+            unregister = self._register_native(parsed, hotkey, callback)
+        else:
+            unregister = self._register_keyboard(hotkey, callback)
+        if unregister is not None:
+            self._registrations[slot] = unregister
+            print(f"[INFO] {label} registered: {hotkey.upper()}")
+
+    def _unregister(self, slot):
+        """Unregister the hotkey held in one slot, if any."""
+        unregister = self._registrations.pop(slot, None)
+        if unregister is not None:
+            try:
+                unregister()
+            except Exception:
+                pass
+
+    def _parse_win_hotkey(self, hotkey):
+        """Parse 'ctrl+shift+o' into RegisterHotKey (modifiers, vk), or None if not a modifier combo."""
+        parts = [p.strip() for p in hotkey.lower().split('+') if p.strip()]
+        if len(parts) < 2:
+            return None
+        modifiers = self._MOD_NOREPEAT
+        for part in parts[:-1]:
+            if part not in self._WIN_MODIFIERS:
+                return None
+            modifiers |= self._WIN_MODIFIERS[part]
+        vk = self._WIN_VK_CODES.get(parts[-1])
+        if vk is None:
+            return None
+        return modifiers, vk
+
+    def _register_native(self, parsed, hotkey, callback):
+        """Register a hotkey with RegisterHotKey on its own message-pump thread.
+
+        Returns a callable that unregisters it, or None on failure.
+        """
+        import ctypes
+
+        state = {}
+        ready = threading.Event()
+        thread = threading.Thread(
+            target=self._native_hotkey_loop, args=(parsed, callback, state, ready), daemon=True
+        )
+        thread.start()
+
+        if not ready.wait(1.0):
+            # The pump may still register later - stop it so it can't hold
+            # the hotkey with nothing left to unregister it
+            state['cancelled'] = True
+            thread_id = state.get('thread_id')
+            if thread_id is not None:
+                ctypes.windll.user32.PostThreadMessageW(thread_id, self._WM_QUIT, 0, 0)
+            thread.join(1.0)
+            print(f"[WARNING] Failed to register global hotkey {hotkey.upper()}: timed out")
+            return None
+
+        if not state.get('registered'):
+            print(f"[WARNING] Failed to register global hotkey {hotkey.upper()}: "
+                  f"{state.get('error', 'already in use by another application')}")
+            return None
+
+        def unregister():
+            # WM_QUIT ends the pump, which then releases the hotkey
+            ctypes.windll.user32.PostThreadMessageW(state['thread_id'], self._WM_QUIT, 0, 0)
+            thread.join(1.0)
+        return unregister
+
+    def _native_hotkey_loop(self, parsed, callback, state, ready):
+        """Own one RegisterHotKey registration and dispatch WM_HOTKEY until WM_QUIT."""
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        msg = wintypes.MSG()
         try:
-            import keyboard
+            # Create this thread's message queue so WM_QUIT can be posted to it
+            user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, 0)
+            state['thread_id'] = ctypes.windll.kernel32.GetCurrentThreadId()
+            modifiers, vk = parsed
+            state['registered'] = bool(user32.RegisterHotKey(None, 1, modifiers, vk))
+        except Exception as e:
+            state['error'] = e
+        finally:
+            ready.set()
 
-            # Register main hotkey
-            keyboard.add_hotkey(self.hotkey, self._on_hotkey)
-            self._registered_hotkeys.append(self.hotkey)
-            print(f"[INFO] Global hotkey registered: {self.hotkey.upper()}")
+        if not state.get('registered'):
+            return
+        if state.get('cancelled'):
+            # _register_native gave up waiting before the WM_QUIT could be posted
+            user32.UnregisterHotKey(None, 1)
+            return
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == self._WM_HOTKEY:
+                callback()
+        # Hotkeys are owned by the registering thread
+        user32.UnregisterHotKey(None, 1)
 
-            # Register alternative hotkey if different
-            if self.alt_hotkey and self.alt_hotkey != self.hotkey:
-                keyboard.add_hotkey(self.alt_hotkey, self._on_alt_hotkey)
-                self._registered_hotkeys.append(self.alt_hotkey)
-                print(f"[INFO] Alternative hotkey registered: {self.alt_hotkey.upper()}")
+    def _register_keyboard(self, hotkey, callback):
+        """Register a hotkey through the keyboard library's global hook.
 
-            self._running = True
+        Returns a callable that unregisters it, or None on failure.
+        """
+        try:
+            import keyboard
+            handle = keyboard.add_hotkey(hotkey, callback)
         except ImportError:
             print("[WARNING] keyboard library not installed. Global hotkey disabled.")
             print("[WARNING] Install with: pip install keyboard")
+            return None
         except Exception as e:
             print(f"[WARNING] Failed to register global hotkey: {e}")
-
-    def stop(self):
-        """Stop listening for global hotkey."""
-        if self._running:
-            try:
-                import keyboard
-                for hotkey in self._registered_hotkeys:
-                    try:
-                        keyboard.remove_hotkey(hotkey)
-                    except Exception:
-                        pass
-                self._registered_hotkeys.clear()
-                self._running = False
-            except Exception:
-                pass
+            return None
+        return lambda: keyboard.remove_hotkey(handle)
 
     def update_hotkeys(self, hotkey=None, alt_hotkey=None, enabled=None):
-        """Update hotkey configuration."""
-        changed = False
-
-        if enabled is not None:
-            self._enabled = enabled
-            changed = True
+        """Update hotkey configuration, re-registering only what changed."""
+        changed = set()
 
         if hotkey is not None and hotkey != self.hotkey:
             self.hotkey = hotkey
-            changed = True
+            changed.add('hotkey')
+            # The alternative hotkey is deduplicated against the main one
+            changed.add('alt_hotkey')
 
         if alt_hotkey is not None and alt_hotkey != self.alt_hotkey:
             self.alt_hotkey = alt_hotkey
-            changed = True
-
-        if changed and self._running:
-            # Restart with new hotkeys
-            self.stop()
-            if self._enabled:
-                self.start()
+            changed.add('alt_hotkey')
+
+        if enabled is not None and enabled != self._enabled:
+            # Affects every hotkey, and registers the new values when enabling
+            self.set_enabled(enabled)
+        elif self._running:
+            # Release every changed hotkey before registering the new ones,
+            # in case they swapped
+            for slot in changed:
+                self._unregister(slot)
+            for slot in ('hotkey', 'alt_hotkey'):
+                if slot in changed:
+                    self._register(slot)
 
     def set_enabled(self, enabled: bool):
         """Enable or disable hotkeys."""
@@ -233,8 +356,16 @@ class GlobalHotkeyManager(QObject):
 _hotkey_manager = None
 
 
+# Tray icon, painted on first use
+_tray_icon = None
+
+
 def create_tray_icon():
-    """Create a simple tray icon programmatically."""
+    """Create a simple tray icon programmatically (cached after the first call)."""
+    global _tray_icon
+    if _tray_icon is not None:
+        return _tray_icon
+
     # Create a 32x32 icon with "OCR" text
     pixmap = QPixmap(32, 32)
     pixmap.fill(QColor(0, 122, 204))  # Blue background
@@ -246,7 +377,8 @@ def create_tray_icon():
     painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "OCR")
     painter.end()
 
-    return QIcon(pixmap)
+    _tray_icon = QIcon(pixmap)
+    return _tray_icon
 
 
 class SystemTrayManager(QObject):
@@ -323,47 +455,46 @@ _tray_manager = None
 def create_splash_screen():
     """Create and show splash screen for faster perceived startup."""
     from PySide6.QtWidgets import QSplashScreen
-    from PySide6.QtCore import Qt
-    from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QFontMetrics
+    from PySide6.QtCore import QRect
+    from PySide6.QtGui import QFontMetrics, QLinearGradient
+
+    width, height = 400, 250
 
     # Create splash pixmap
-    pixmap = QPixmap(400, 250)
+    pixmap = QPixmap(width, height)
     pixmap.fill(QColor("#1e1e1e"))
 
     painter = QPainter(pixmap)
 
     # Draw gradient background
-    from PySide6.QtGui import QLinearGradient
-    gradient = QLinearGradient(0, 0, 0, 250)
+    gradient = QLinearGradient(0, 0, 0, height)
     gradient.setColorAt(0, QColor("#2d2d2d"))
     gradient.setColorAt(1, QColor("#1e1e1e"))
     painter.fillRect(pixmap.rect(), gradient)
 
-    # Draw title
-    painter.setPen(QColor("#ffffff"))
+    # Place each line in an explicit rect from its font's line height,
+    # instead of padding the text with newlines
     title_font = QFont("Segoe UI", 24, QFont.Weight.Bold)
-    painter.setFont(title_font)
-    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, "\nScreenOCR")
-
-    # Draw subtitle
-    painter.setPen(QColor("#007acc"))
     subtitle_font = QFont("Segoe UI", 12)
-    painter.setFont(subtitle_font)
-    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, "\n\n\n\n桌面截图 OCR 工具")
-
-    # Draw loading text
-    painter.setPen(QColor("#a0a0a0"))
     loading_font = QFont("Segoe UI", 10)
-    painter.setFont(loading_font)
-    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom, "正在启动...\n")
-
-    # Draw version
-    painter.setPen(QColor("#6e6e6e"))
     version_font = QFont("Segoe UI", 9)
-    painter.setFont(version_font)
-    painter.drawText(pixmap.rect().adjusted(0, 0, -20, -10),
-                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
-                    "v1.0.0")
+    title_h = QFontMetrics(title_font).height()
+    subtitle_h = QFontMetrics(subtitle_font).height()
+    loading_h = QFontMetrics(loading_font).height()
+
+    center = Qt.AlignmentFlag.AlignCenter
+    lines = (
+        # (font, color, rect, alignment, text)
+        (title_font, "#ffffff", QRect(0, title_h, width, title_h), center, "ScreenOCR"),
+        (subtitle_font, "#007acc", QRect(0, 4 * subtitle_h, width, subtitle_h), center, "桌面截图 OCR 工具"),
+        (loading_font, "#a0a0a0", QRect(0, height - 2 * loading_h, width, loading_h), center, "正在启动..."),
+        (version_font, "#6e6e6e", pixmap.rect().adjusted(0, 0, -20, -10),
+         Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom, "v1.0.0"),
+    )
+    for font, color, rect, alignment, text in lines:
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(rect, alignment, text)
 
     painter.end()
 
@@ -480,9 +611,8 @@ def main():
     sys.exit(app.exec())
 
 
-def get_dark_theme_stylesheet():
-    """Return dark theme QSS stylesheet."""
-    return """
+# Dark theme QSS, applied once to the whole application
+_DARK_THEME_QSS = """
     /* Main Window */
     QMainWindow {
         background-color: #1e1e1e;
@@ -701,5 +831,10 @@ def get_dark_theme_stylesheet():
     """
 
 
+def get_dark_theme_stylesheet():
+    """Return dark theme QSS stylesheet."""
+    return _DARK_THEME_QSS
+
+
 if __name__ == "__main__":
     main()